@@ -24,6 +24,7 @@ Konventionen (Spec 3.1):
 from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 
 Record = dict[str, Any]
@@ -45,15 +46,27 @@ BOOKING_OVERTIME = 2
 # ── Basic conversions (spec 3.1, 2.3) ───────────────────────────
 
 
+# Dieselben Tagesdaten werden je Zeitraumsumme und Mitarbeiter erneut
+# geparst; date ist unveränderlich und damit gefahrlos geteilt.
+@lru_cache(maxsize=8192)
+def _iso_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
 def to_date(value: Any) -> date | None:
     """Coerce a record date value (ISO string from read_dbf or date) to date."""
-    if value is None or value == "":
+    if type(value) is str:
+        return _iso_date(value) if value else None
+    if value is None:
         return None
     if isinstance(value, date):
         return value
-    return date.fromisoformat(str(value))
+    return _iso_date(str(value))
 
 
+# Wenige verschiedene Masken, aber je Zuschlagsart und Tag erneut geparst
+# (extracharge_hours_on_day) — das Ergebnis-Tupel ist unveränderlich.
+@lru_cache(maxsize=256)
 def parse_day_mask(mask: str, slots: int) -> tuple[bool, ...]:
     """Parse a weekday flag mask (D-35/D-36).
 
@@ -142,7 +155,7 @@ def _dated_entries(
 # ── Employee context (5EMPL calculation parameters) ─────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmployeeContext:
     """Calculation-relevant 5EMPL parameters (spec 3.1/3.3.1)."""
 
@@ -615,7 +628,7 @@ def charge_factor(leave_type: Record, hrs_day: float) -> float:
     return 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AbsenceSums:
     """Spec 3.5.4 Nr. 5: die drei Stundensummen über einen Zeitraum."""
 
@@ -783,7 +796,7 @@ def leave_taken(
     return hours
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LeaveAccount:
     """Spec 3.7.1 Nr. 5: die fünf Werte einer Anspruchs-Statistikzeile."""
 
@@ -88,7 +88,7 @@ Blätter, z. B. ``5HOLID``).
 import os
 import struct
 
-from .dbf_reader import _dedupe_names, get_table_fields, read_dbf
+from .dbf_reader import _dedupe_names, count_records, get_table_fields
 
 PAGE = 512
 
@@ -172,9 +172,16 @@ def _build_keys(filepath: str, key_expr: str) -> tuple[list[tuple[bytes, int]],
 
     # Rohe Sätze mit physischen Positionen lesen (read_dbf lässt gelöschte
     # Zeilen weg, verliert dabei aber die Position — hier positional neu lesen).
-    from .dbf_reader import _parse_record
+    from .dbf_reader import _compile_field_specs, _parse_record_specs, _project_specs
     from .dbf_writer import _read_header_info
 
+    # Feld-Specs einmal je Tabelle, nur für die Schlüsselfelder (ein im
+    # Ausdruck genanntes, aber fehlendes Feld zählt wie bisher als 0).
+    key_fields = [spec] if kind == "numeric" else [field for field, _ in spec]
+    specs = _project_specs(
+        _compile_field_specs(fields, names), [n for n in key_fields if n in names]
+    )
+
     num_records, header_size, record_size = _read_header_info(filepath)
     keys: list[tuple[bytes, int]] = []
     with open(filepath, "rb") as f:
@@ -185,7 +192,7 @@ def _build_keys(filepath: str, key_expr: str) -> tuple[list[tuple[bytes, int]],
                 break
             if raw[0] == 0x2A:  # deleted → excluded by .NOT. DELETED()
                 continue
-            record = _parse_record(raw, fields, names)
+            record = _parse_record_specs(raw, specs)
             recno = raw_idx + 1  # CodeBase record numbers are 1-based
             if kind == "numeric":
                 key = _numeric_key(record.get(spec) or 0)
@@ -537,7 +544,7 @@ def write_cdx(filepath: str) -> str | None:
         return None
     tag_name = _read_tag_name(cdx_path) or _TAG_NAME
 
-    num_records = len(read_dbf(filepath))
+    num_records = count_records(filepath)
     counter = _read_counter(cdx_path, default=num_records)
     data = build_cdx_bytes(filepath, key_expr, counter, tag_name)
 
@@ -548,18 +555,28 @@ def write_cdx(filepath: str) -> str | None:
     return cdx_path
 
 
+def _read_taglist_leaf(f) -> bytes | None:
+    """Read the tag-list leaf page of an open CDX, or ``None`` if it is too short.
+
+    Only the header word and the one leaf page are read — a table's CDX grows
+    with its record count, the metadata needed for a rebuild does not.
+    """
+    if os.fstat(f.fileno()).st_size < (_TAGLIST_ROOT_PAGE + 1) * PAGE:
+        return None
+    taglist_root = struct.unpack("<I", f.read(4))[0]
+    f.seek(taglist_root)
+    leaf = f.read(PAGE)
+    return leaf if len(leaf) == PAGE else None
+
+
 def _read_tag_name(cdx_path: str) -> str | None:
     """Read the tag name from the existing CDX's tag-list leaf."""
     try:
         with open(cdx_path, "rb") as f:
-            data = f.read()
+            leaf = _read_taglist_leaf(f)
     except OSError:
         return None
-    if len(data) < (_TAGLIST_ROOT_PAGE + 1) * PAGE:
-        return None
-    taglist_root = struct.unpack_from("<I", data, 0)[0]
-    leaf = data[taglist_root : taglist_root + PAGE]
-    if len(leaf) < PAGE or struct.unpack_from("<H", leaf, 2)[0] < 1:
+    if leaf is None or struct.unpack_from("<H", leaf, 2)[0] < 1:
         return None
     recno_bits = leaf[20]
     dup_mask = leaf[18]
@@ -583,24 +600,21 @@ def _read_key_expr(cdx_path: str) -> str | None:
     """
     try:
         with open(cdx_path, "rb") as f:
-            data = f.read()
+            # Tag-Listen-Blatt → Tag-Header-Offset → Schlüssellänge; der
+            # Expression-Pool liegt direkt nach dem Tag-Header. Im Ein-Tag-
+            # SP5-Schema ist der Tag-Header Seite 2 und sein Expression-Pool
+            # Seite 3.
+            leaf = _read_taglist_leaf(f)
+            if leaf is None:
+                return None
+            recno_mask = struct.unpack_from("<I", leaf, 14)[0]
+            entry_bytes = leaf[23] or 3
+            if struct.unpack_from("<H", leaf, 2)[0] < 1:
+                return None
+            tag_hdr_off = int.from_bytes(leaf[24 : 24 + entry_bytes], "little") & recno_mask
+            f.seek(tag_hdr_off + PAGE)  # expression pool page follows the tag header
+            blob = f.read(PAGE)
     except OSError:
         return None
-    if len(data) < _TAGLIST_ROOT_PAGE * PAGE + PAGE:
-        return None
-    # Tag-Listen-Blatt → Tag-Header-Offset → Schlüssellänge; der Expression-
-    # Pool liegt direkt nach dem Tag-Header. Im Ein-Tag-SP5-Schema ist der
-    # Tag-Header Seite 2 und sein Expression-Pool Seite 3.
-    taglist_root = struct.unpack_from("<I", data, 0)[0]
-    leaf = data[taglist_root : taglist_root + PAGE]
-    if len(leaf) < PAGE:
-        return None
-    recno_mask = struct.unpack_from("<I", leaf, 14)[0]
-    entry_bytes = leaf[23] or 3
-    if struct.unpack_from("<H", leaf, 2)[0] < 1:
-        return None
-    tag_hdr_off = int.from_bytes(leaf[24 : 24 + entry_bytes], "little") & recno_mask
-    expr_off = tag_hdr_off + PAGE  # expression pool page follows the tag header
-    blob = data[expr_off : expr_off + PAGE]
     key_expr = blob.split(b"\x00", 1)[0].decode("ascii", errors="replace")
     return key_expr or None
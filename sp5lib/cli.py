@@ -1,20 +1,32 @@
 """sp5lib — Kommandozeilen-Werkzeuge für Schichtplaner5-DBF-Datenbanken.
 
-    sp5lib info     /pfad/zu/Daten
-    sp5lib dump     /pfad/zu/Daten 5EMPL [--json|--csv] [--limit N]
-    sp5lib validate /pfad/zu/Daten
+    sp5lib info     /pfad/zu/Daten [--jobs N]
+    sp5lib dump     /pfad/zu/Daten 5EMPL [--json|--csv] [--limit N] [--fields ID,NAME]
+    sp5lib validate /pfad/zu/Daten [--jobs N]
     sp5lib sync     /pfad/zu/Daten --target sqlite:/pfad/sp5.db
     sp5lib sync     /pfad/zu/Daten --target postgres://user:pw@host:5432/db
 """
 
 import argparse
 import csv
-import json
+import itertools
 import os
 import sys
-from typing import Any
+from collections.abc import Callable, Iterable
+from json.encoder import encode_basestring
+from typing import Any, TextIO, TypeVar
 
-from sp5lib.dbf_reader import _dedupe_names, get_table_fields, read_dbf
+from sp5lib.dbf_reader import (
+    BINARY_C_FIELDS,
+    _dedupe_names,
+    _prefetch,
+    count_records,
+    get_table_fields,
+    iter_dbf,
+    iter_dbf_rows,
+)
+
+T = TypeVar("T")
 
 
 def _dbf_files(db_dir: str) -> list[str]:
@@ -40,6 +52,80 @@ def _plain(value: Any) -> Any:
     return value.hex() if isinstance(value, bytes) else value
 
 
+def _json_value(value: Any) -> str:
+    """Einen DBF-Feldwert wie ``json.dumps(..., ensure_ascii=False)`` kodieren.
+
+    DBF-Werte sind flach (str/int/float/bool/None/bytes); die direkte
+    Typ-Dispatch spart den allgemeinen Encoder-Durchlauf je Wert.
+    """
+    t = type(value)
+    if t is str:
+        return encode_basestring(value)
+    if t is int:
+        return int.__repr__(value)
+    if t is float:
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "Infinity" if value > 0 else "-Infinity"
+        return float.__repr__(value)
+    if value is None:
+        return "null"
+    if t is bool:
+        return "true" if value else "false"
+    return encode_basestring(str(_plain(value)))
+
+
+def _write_json(rows: Iterable[tuple[Any, ...]], names: list[str], out: TextIO) -> None:
+    """Werte-Tupel als JSON-Array von Objekten streamen, byte-gleich zu ``json.dump(indent=2)``.
+
+    Alle Datensätze einer Tabelle haben dieselben Schlüssel in derselben
+    Reihenfolge (*names*), daher werden die Schlüssel-Präfixe nur einmal
+    kodiert und je Datensatz nur die Werte (aus :func:`iter_dbf_rows`, ohne
+    Umweg über ein dict).
+    """
+    prefixes = [
+        ("{\n    " if i == 0 else ",\n    ") + encode_basestring(name) + ": "
+        for i, name in enumerate(names)
+    ]
+    write = out.write
+    write("[")
+    sep = "\n  "
+    for row in rows:
+        write(sep)
+        sep = ",\n  "
+        if prefixes:
+            parts = [p + _json_value(v) for p, v in zip(prefixes, row, strict=True)]
+            write("".join(parts) + "\n  }")
+        else:
+            write("{}")
+    write("]" if sep == "\n  " else "\n]")
+
+
+def _limit(text: str) -> int:
+    """argparse-Typ für --limit: nicht-negative Ganzzahl."""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"--limit muss >= 0 sein, nicht {value}")
+    return value
+
+
+def _jobs(text: str) -> int:
+    """argparse-Typ für --jobs: Anzahl Worker-Prozesse, 0 = alle CPU-Kerne."""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"--jobs muss >= 0 sein, nicht {value}")
+    return value or os.cpu_count() or 1
+
+
+def _field_list(text: str) -> list[str]:
+    """argparse-Typ für --fields: Feldnamen in Großschrift, doppelte entfernt."""
+    names = list(dict.fromkeys(n.strip().upper() for n in text.split(",") if n.strip()))
+    if not names:
+        raise argparse.ArgumentTypeError(f"--fields enthält keine Feldnamen: {text!r}")
+    return names
+
+
 def _target_url(target: str) -> str:
     """``sqlite:PATH`` / ``postgres:URL`` in eine SQLAlchemy-URL übersetzen."""
     scheme, _, rest = target.partition(":")
@@ -58,6 +144,37 @@ def _target_url(target: str) -> str:
     raise ValueError(f"Unbekanntes Target {target!r} (erwartet sqlite:PATH oder postgres:URL)")
 
 
+def _map_tables(fn: Callable[[str], T], paths: list[str], jobs: int) -> list[T]:
+    """*fn* auf alle Tabellenpfade anwenden, bei ``jobs > 1`` in Worker-Prozessen.
+
+    DBF-Parsing ist CPU-gebunden und je Datei unabhängig; die Worker liefern
+    nur kleine Zusammenfassungen zurück, nicht die Datensätze. Die Ergebnis-
+    Reihenfolge entspricht *paths*, die Ausgabe bleibt also deterministisch.
+    Alle Dateien werden vorab per :func:`_prefetch` beim Kernel angefordert.
+    """
+    _prefetch(paths)
+    if jobs <= 1 or len(paths) < 2:
+        return [fn(p) for p in paths]
+    # erst hier importieren: concurrent.futures.process zieht multiprocessing
+    # nach und kostete jedem CLI-Aufruf (auch --help) rund 30 ms Startzeit
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(fn, paths))
+
+
+def _info_row(path: str) -> tuple[int | None, int, Any]:
+    """(Feldanzahl oder None bei unlesbarem Header, Records, BUILD aus 5BUILD)."""
+    fields = get_table_fields(path)
+    if not fields:
+        return None, 0, None
+    # Nur zählen (Löschmarken), nicht dekodieren; 5BUILD: nur der erste Satz.
+    build = None
+    if os.path.basename(path).upper() == "5BUILD.DBF":
+        build = next(iter_dbf(path), {}).get("BUILD")
+    return len(fields), count_records(path), build
+
+
 def cmd_info(args: argparse.Namespace) -> int:
     files = _dbf_files(args.db_dir)
     if not files:
@@ -67,17 +184,17 @@ def cmd_info(args: argparse.Namespace) -> int:
     print(f"{'Tabelle':<16} {'Records':>8} {'Felder':>7}")
     total = 0
     build = None
-    for name in files:
-        path = os.path.join(args.db_dir, name)
-        fields = get_table_fields(path)
-        if not fields:
+    paths = [os.path.join(args.db_dir, name) for name in files]
+    for name, (n_fields, n_records, table_build) in zip(
+        files, _map_tables(_info_row, paths, args.jobs), strict=True
+    ):
+        if n_fields is None:
             print(f"{name:<16} {'-':>8} {'-':>7}  (Header nicht lesbar)")
             continue
-        records = read_dbf(path)
-        total += len(records)
-        print(f"{name:<16} {len(records):>8} {len(fields):>7}")
-        if name.upper() == "5BUILD.DBF" and records:
-            build = records[0].get("BUILD")
+        total += n_records
+        print(f"{name:<16} {n_records:>8} {n_fields:>7}")
+        if table_build is not None:
+            build = table_build
     print(f"\nGesamt: {len(files)} Tabellen, {total} Records")
     if build is not None:
         print(f"Schichtplaner5-Build: {build}")
@@ -90,22 +207,59 @@ def cmd_dump(args: argparse.Namespace) -> int:
         print(f"Tabelle {args.table!r} nicht gefunden in {args.db_dir}", file=sys.stderr)
         return 1
 
-    records = read_dbf(path)
-    if args.limit is not None:
-        records = records[: args.limit]
-
+    # Streamend: Datensatz für Datensatz lesen und schreiben, --limit bricht
+    # das Lesen ab — große Tabellen werden nie komplett in den Speicher geladen.
+    table_fields = get_table_fields(path)
+    names = _dedupe_names([str(f["name"]) for f in table_fields])
+    binary_names = {
+        name
+        for name, f in zip(names, table_fields, strict=True)
+        if f["type"] == "C" and f["name"] in BINARY_C_FIELDS
+    }
+    fields = None
+    if args.fields:
+        # Projektion: nur diese Spalten dekodieren und ausgeben.
+        fields = args.fields
+        unknown = [n for n in fields if n not in names]
+        if unknown:
+            print(f"Unbekannte Felder in {args.table!r}: {', '.join(unknown)}", file=sys.stderr)
+            return 1
+        names = fields
     if args.csv:
-        names = _dedupe_names([str(f["name"]) for f in get_table_fields(path)])
-        writer = csv.DictWriter(sys.stdout, fieldnames=names)
-        writer.writeheader()
-        for record in records:
-            writer.writerow({k: _plain(v) for k, v in record.items()})
+        # csv.writer auf den Werte-Tupeln (iter_dbf_rows): kein dict je
+        # Datensatz, writerows iteriert in C. Nur Tabellen mit Binärfeldern
+        # (5USER, 5BUILD — wenige Zeilen) brauchen den _plain-Durchlauf.
+        rows: Iterable[Iterable[Any]] = itertools.islice(iter_dbf_rows(path, fields), args.limit)
+        if any(name in binary_names for name in names):
+            rows = ([_plain(v) for v in row] for row in rows)
+        writer = csv.writer(sys.stdout)
+        writer.writerow(names)
+        writer.writerows(rows)
     else:
-        json.dump(records, sys.stdout, ensure_ascii=False, indent=2, default=_plain)
+        _write_json(itertools.islice(iter_dbf_rows(path, fields), args.limit), names, sys.stdout)
         print()
     return 0
 
 
+def _validate_row(path: str) -> tuple[bool, str]:
+    """(Problem gefunden?, Ausgabezeile) für eine Tabelle."""
+    name = os.path.basename(path)
+    fields = get_table_fields(path)
+    if not fields:
+        return True, f"FEHLER   {name}: Header nicht lesbar"
+    bad_names = [str(f["name"]) for f in fields if "�" in str(f["name"])]
+    if bad_names:
+        return True, f"ENCODING {name}: defekte Feldnamen {bad_names}"
+    # streamend prüfen: je Worker nie die ganze Tabelle im Speicher
+    n_records = bad_values = 0
+    for row in iter_dbf_rows(path):
+        n_records += 1
+        bad_values += sum(1 for v in row if isinstance(v, str) and "�" in v)
+    if bad_values:
+        return True, f"ENCODING {name}: {bad_values} Feldwerte mit Ersatzzeichen (U+FFFD)"
+    return False, f"OK       {name} ({n_records} Records)"
+
+
 def cmd_validate(args: argparse.Namespace) -> int:
     files = _dbf_files(args.db_dir)
     if not files:
@@ -113,27 +267,10 @@ def cmd_validate(args: argparse.Namespace) -> int:
         return 1
 
     problems = 0
-    for name in files:
-        path = os.path.join(args.db_dir, name)
-        fields = get_table_fields(path)
-        if not fields:
-            print(f"FEHLER   {name}: Header nicht lesbar")
-            problems += 1
-            continue
-        bad_names = [str(f["name"]) for f in fields if "�" in str(f["name"])]
-        if bad_names:
-            print(f"ENCODING {name}: defekte Feldnamen {bad_names}")
-            problems += 1
-            continue
-        records = read_dbf(path)
-        bad_values = sum(
-            1 for r in records for v in r.values() if isinstance(v, str) and "�" in v
-        )
-        if bad_values:
-            print(f"ENCODING {name}: {bad_values} Feldwerte mit Ersatzzeichen (U+FFFD)")
-            problems += 1
-        else:
-            print(f"OK       {name} ({len(records)} Records)")
+    paths = [os.path.join(args.db_dir, name) for name in files]
+    for is_problem, line in _map_tables(_validate_row, paths, args.jobs):
+        print(line)
+        problems += is_problem
 
     if problems:
         print(f"\n{problems} von {len(files)} Tabellen mit Problemen")
@@ -173,9 +310,16 @@ def main(argv: list[str] | None = None) -> int:
         description="Werkzeuge für Schichtplaner5-DBF-Datenbanken (lesen, prüfen, synchronisieren).",
     )
     sub = parser.add_subparsers(dest="command", required=True)
+    jobs_opt: dict[str, Any] = {
+        "type": _jobs,
+        "default": 1,
+        "metavar": "N",
+        "help": "Tabellen in N Prozessen parallel lesen (0 = alle CPU-Kerne)",
+    }
 
     p = sub.add_parser("info", help="Tabellenübersicht: Records je Tabelle, SP5-Build")
     p.add_argument("db_dir", help="Verzeichnis mit den 5*.DBF-Dateien")
+    p.add_argument("-j", "--jobs", **jobs_opt)
     p.set_defaults(func=cmd_info)
 
     p = sub.add_parser("dump", help="Tabelle als JSON (Default) oder CSV ausgeben")
@@ -184,11 +328,15 @@ def main(argv: list[str] | None = None) -> int:
     fmt = p.add_mutually_exclusive_group()
     fmt.add_argument("--json", action="store_true", help="JSON-Ausgabe (Default)")
     fmt.add_argument("--csv", action="store_true", help="CSV-Ausgabe")
-    p.add_argument("--limit", type=int, metavar="N", help="höchstens N Records ausgeben")
+    p.add_argument("--limit", type=_limit, metavar="N", help="höchstens N Records ausgeben")
+    p.add_argument(
+        "--fields", type=_field_list, metavar="FELD,…", help="nur diese Felder ausgeben, z. B. ID,NAME"
+    )
     p.set_defaults(func=cmd_dump)
 
     p = sub.add_parser("validate", help="alle Tabellen lesen, Fehler/Encoding-Probleme melden")
     p.add_argument("db_dir", help="Verzeichnis mit den 5*.DBF-Dateien")
+    p.add_argument("-j", "--jobs", **jobs_opt)
     p.set_defaults(func=cmd_validate)
 
     p = sub.add_parser("sync", help="DBF nach SQLite/PostgreSQL synchronisieren (sp5lib.orm.sync)")
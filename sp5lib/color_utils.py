@@ -1,6 +1,11 @@
 """Color conversion utilities for Schichtplaner5 colors (stored as Windows BGR integers)."""
 
+from functools import lru_cache
 
+
+# Called per schedule cell and per display record, but a database only uses a
+# few dozen distinct colors. typed=True keeps 1.0 (-> white) apart from 1.
+@lru_cache(maxsize=1024, typed=True)
 def bgr_to_hex(bgr: int) -> str:
     """Convert Windows BGR integer to HTML hex color string."""
     if not isinstance(bgr, int) or bgr < 0:
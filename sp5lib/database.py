@@ -9,13 +9,14 @@ import json
 import logging
 import os
 import threading
+from collections.abc import Callable, Iterable
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import Any, Literal
 
 from . import _resource_paths as _paths
 from . import calculations as calc
 from .color_utils import bgr_to_hex, is_light_color
-from .dbf_reader import get_table_fields, read_dbf, read_dbf_buffer
+from .dbf_reader import _prefetch, count_records, get_table_fields, read_dbf, read_dbf_buffer
 from .dbf_writer import (
     _read_header_info as _dbf_header_info,
 )
@@ -37,6 +38,13 @@ from .dbf_writer import (
 
 _db_logger = logging.getLogger("sp5api")
 
+#: Status eines Schichttausch-Antrags (JSON-Ablage, siehe create_swap_request).
+SwapStatus = Literal["pending_partner", "pending", "approved", "rejected", "cancelled", "expired"]
+#: Offene Anträge — nur diese laufen ab (expire_old_swap_requests).
+_OPEN_SWAP_STATUSES = frozenset({"pending", "pending_partner"})
+#: Stichwörter in NAME/SHORTNAME einer Krankheits-Abwesenheitsart (_is_sick_leave_type).
+_SICK_KEYWORDS = ("krank", "sick", "ku")
+
 # ── Globaler Request-übergreifender DBF-Cache ───────────────────
 # Bildet (db_path, table_name) → (mtime, data) ab.
 # Erspart das Neu-Einlesen unveränderter DBF-Dateien über Requests hinweg.
@@ -48,6 +56,10 @@ _GLOBAL_DBF_CACHE: dict[tuple, tuple] = {}
 # get_schedule nur den angefragten Monat statt der ganzen Tabelle scannt. An die
 # gleiche mtime gekoppelt wie _GLOBAL_DBF_CACHE → konsistent invalidiert.
 _GLOBAL_MONTH_INDEX: dict[tuple, tuple] = {}
+# Allgemeine abgeleitete Strukturen (Fremdschlüssel-Index, Feiertagskalender, …):
+# (db_path, table, tag) → (content_hash, value). Ebenfalls an den Inhalts-Hash
+# gekoppelt, damit sie nur bei echt geändertem Tabelleninhalt neu gebaut werden.
+_GLOBAL_DERIVED: dict[tuple, tuple] = {}
 _CACHE_LOCK = threading.RLock()
 
 
@@ -68,14 +80,15 @@ def _invalidate_cache_for_file(filepath: str) -> None:
         ]
         for key in stale:
             _GLOBAL_DBF_CACHE.pop(key, None)
-        # Den abgeleiteten Monatsindex derselben Tabelle ebenfalls verwerfen.
-        stale_idx = [
-            k
-            for k in _GLOBAL_MONTH_INDEX
-            if os.path.normpath(os.path.join(k[0], f"5{k[1]}.DBF")) == target
-        ]
-        for k in stale_idx:
-            _GLOBAL_MONTH_INDEX.pop(k, None)
+        # Die abgeleiteten Indizes derselben Tabelle ebenfalls verwerfen.
+        for index in (_GLOBAL_MONTH_INDEX, _GLOBAL_DERIVED):
+            stale_idx = [
+                k
+                for k in index
+                if os.path.normpath(os.path.join(k[0], f"5{k[1]}.DBF")) == target
+            ]
+            for k in stale_idx:
+                index.pop(k, None)
 
 
 # dbf_writer-Funktionen mit zentraler Cache-Invalidierung umhüllt, damit
@@ -150,6 +163,12 @@ class SP5Database:
             _db_logger.error(
                 "DBF read error: table=%s path=%s error=%s", name, path, _exc
             )
+            if isinstance(_exc, FileNotFoundError) and (mtime, size) == (0.0, 0):
+                # Fehlende (optionale) Tabelle als leer cachen: sonst wiederholt
+                # jeder Aufruf stat + open + Error-Log. Legt jemand die Datei
+                # an, ändert sich (mtime, size) und der Schnellpfad greift nicht.
+                with _CACHE_LOCK:
+                    _GLOBAL_DBF_CACHE[key] = (mtime, size, b"", [])
             return []
 
         content_hash = hashlib.blake2b(raw_bytes, digest_size=16).digest()
@@ -197,6 +216,93 @@ class SP5Database:
             _GLOBAL_MONTH_INDEX[key] = (content_hash, index)
         return index
 
+    def _derived(self, name: str, tag: Any, build: Callable[[list[dict]], Any]) -> Any:
+        """Aus einer Tabelle abgeleiteten Wert einmal pro Tabelleninhalt bauen.
+
+        ``build(records)`` läuft nur, wenn sich der Inhalts-Hash von *name*
+        seit dem letzten Aufruf mit demselben *tag* geändert hat; sonst kommt
+        das gecachte Ergebnis zurück (geteilt — Aufrufer dürfen es nicht
+        verändern).
+        """
+        data = self._read(name)
+        with _CACHE_LOCK:
+            entry = _GLOBAL_DBF_CACHE.get((self.db_path, name))
+            content_hash = entry[2] if entry is not None else None
+            key = (self.db_path, name, tag)
+            cached = _GLOBAL_DERIVED.get(key)
+            if cached is not None and cached[0] == content_hash:
+                return cached[1]
+
+        value = build(data)
+        with _CACHE_LOCK:
+            _GLOBAL_DERIVED[key] = (content_hash, value)
+        return value
+
+    def _read_by_field(
+        self, name: str, field: str = "EMPLOYEEID"
+    ) -> dict[Any, list[dict[str, Any]]]:
+        """Datensätze einer Tabelle nach dem Wert von *field* gruppiert (Hash-Index).
+
+        Über :meth:`_derived` an den Inhalts-Hash gekoppelt; der Index wird
+        einmal pro Tabelleninhalt gebaut. Datensätze ohne Wert (``None``) fehlen
+        im Index — sie matchten auch beim früheren ``r.get(field) == id``-Scan
+        keine gültige ID. Aufrufer lesen mit ``.get(value, ())`` und dürfen die
+        Listen nicht verändern.
+        """
+
+        def build(data: list[dict]) -> dict[Any, list[dict[str, Any]]]:
+            index: dict[Any, list[dict[str, Any]]] = {}
+            for r in data:
+                v = r.get(field)
+                if v is not None:
+                    index.setdefault(v, []).append(r)
+            return index
+
+        return self._derived(name, ("by", field), build)
+
+    # Tabellen und Indizes, die Requests typischerweise als Erstes anfassen
+    # (Stammdaten, Dienstplan nach Monat, Fremdschlüssel je Mitarbeiter).
+    _WARM_TABLES = ("EMPL", "GROUP", "SHIFT", "LEAVT", "WOPL", "HOLID")
+    _WARM_FIELD_INDEXES = (
+        ("GRASG", "EMPLOYEEID"),
+        ("LEAEN", "EMPLOYEEID"),
+        ("ABSEN", "EMPLOYEEID"),
+        ("BOOK", "EMPLOYEEID"),
+    )
+
+    def warm_cache(self) -> list[str]:
+        """DBF-Cache und abgeleitete Indizes vorab aufbauen (z. B. beim App-Start).
+
+        Liest die häufig gebrauchten Tabellen einmal ein und baut Monatsindex
+        (5MASHI), Feiertagskalender und die Mitarbeiter-Fremdschlüssel-Indizes,
+        damit der erste Request nicht die Parse- und Scan-Kosten trägt. Fehlende
+        Tabellen werden übersprungen. Liefert die vorgewärmten Tabellennamen.
+        """
+        warmed: list[str] = []
+
+        def present(name: str) -> bool:
+            if name in warmed:
+                return True
+            if not os.path.exists(self._table(name)):
+                return False
+            warmed.append(name)
+            return True
+
+        # Alle Dateien vorab beim Kernel anfordern, dann der Reihe nach parsen.
+        index_tables = [name for name, _field in self._WARM_FIELD_INDEXES]
+        _prefetch(self._table(n) for n in (*self._WARM_TABLES, "MASHI", *index_tables))
+        for name in self._WARM_TABLES:
+            if present(name):
+                self._read(name)
+        if present("MASHI"):
+            self._read_by_month("MASHI")
+        if "HOLID" in warmed:
+            self._calc_holidays()
+        for name, field in self._WARM_FIELD_INDEXES:
+            if present(name):
+                self._read_by_field(name, field)
+        return warmed
+
     def _invalidate_cache(self, name: str) -> None:
         """Verwirft den globalen Cache-Eintrag einer Tabelle nach einem Write.
 
@@ -207,10 +313,11 @@ class SP5Database:
         key = (self.db_path, name)
         with _CACHE_LOCK:
             _GLOBAL_DBF_CACHE.pop(key, None)
-            # Den abgeleiteten Monatsindex derselben Tabelle miträumen
-            # (mehrere date_field-Varianten möglich).
-            for ik in [k for k in _GLOBAL_MONTH_INDEX if k[0] == self.db_path and k[1] == name]:
-                _GLOBAL_MONTH_INDEX.pop(ik, None)
+            # Die abgeleiteten Indizes derselben Tabelle miträumen
+            # (mehrere date_field-/field-Varianten möglich).
+            for index in (_GLOBAL_MONTH_INDEX, _GLOBAL_DERIVED):
+                for ik in [k for k in index if k[0] == self.db_path and k[1] == name]:
+                    index.pop(ik, None)
 
     def _color_fields(self, record: dict) -> dict:
         """Convert BGR color fields to hex strings."""
@@ -227,10 +334,38 @@ class SP5Database:
                 record[key + "_LIGHT"] = is_light_color(record[key])
         return record
 
+    def _presented(
+        self,
+        name: str,
+        prepare: Callable[[dict], None] | None = None,
+        key: Callable[[dict], Any] = lambda x: x.get("POSITION", 0),
+    ) -> list[dict]:
+        """Sortierte Anzeige-Sicht einer Stammdatentabelle (inkl. ``*_HEX``-Farben).
+
+        Arbeitet auf Kopien: die Datensätze aus :meth:`_read` bleiben
+        unverändert, die Sicht wird über :meth:`_derived` einmal pro
+        Tabelleninhalt gebaut. Getter filtern daraus in eine neue Liste.
+        """
+
+        def build(rows: list[dict]) -> list[dict]:
+            view = []
+            for r in rows:
+                r = self._color_fields(dict(r))
+                if prepare is not None:
+                    prepare(r)
+                view.append(r)
+            view.sort(key=key)
+            return view
+
+        return self._derived(name, "presented", build)
+
     # ── Berechnungsschicht-Adapter (sp5lib.calculations, Spec Kap. 3) ──
     def _calc_holidays(self) -> dict[date, int]:
-        """5HOLID als date->INTERVAL-Kalender (0 = ganztägig, sonst halb)."""
-        return calc.holiday_calendar(self._read("HOLID"))
+        """5HOLID als date->INTERVAL-Kalender (0 = ganztägig, sonst halb).
+
+        Einmal pro 5HOLID-Inhalt gebaut (:meth:`_derived`); nicht verändern.
+        """
+        return self._derived("HOLID", "calendar", calc.holiday_calendar)
 
     @staticmethod
     def _calc_context(emp: dict) -> calc.EmployeeContext:
@@ -343,53 +478,49 @@ class SP5Database:
     # ── Employees ──────────────────────────────────────────────
     def get_employees(self, include_hidden: bool = False) -> list[dict]:
         """Liefert die aktiven Mitarbeiter, optional inklusive versteckter."""
-        rows = self._read("EMPL")
-        result = []
-        for r in rows:
-            if not include_hidden and r.get("HIDE"):
-                continue
-            # Parse WORKDAYS: stored as plain ASCII "1 1 1 1 1 0 0 0"
-            # (dbf_reader now correctly decodes ASCII vs UTF-16 LE fields)
-            wd = r.get("WORKDAYS", "")
-            if wd:
-                r["WORKDAYS_LIST"] = [x == "1" for x in wd.split()]
-            else:
-                r["WORKDAYS_LIST"] = []
-            # Auto-generate SHORTNAME if empty:
-            # Format: Vorname-Initial + erste 2 Buchstaben Nachname (uppercase)
-            # e.g. "Hans Mueller" → "HMU"  (H from Hans, MU from Mueller)
-            original_shortname = (r.get("SHORTNAME") or "").strip()
-            if not original_shortname:
-                surname = (r.get("NAME", "") or "").strip()
-                firstname = (r.get("FIRSTNAME", "") or "").strip()
-                if firstname and surname:
-                    r["SHORTNAME"] = (firstname[0] + surname[:2]).upper()
-                elif surname:
-                    r["SHORTNAME"] = surname[:3].upper()
-                elif firstname:
-                    r["SHORTNAME"] = firstname[:3].upper()
-                else:
-                    r["SHORTNAME"] = "???"
-                r["SHORTNAME_GENERATED"] = (
-                    True  # flag: was auto-generated, not stored in DB
-                )
-            else:
-                r["SHORTNAME"] = original_shortname
-                r["SHORTNAME_GENERATED"] = False
-            # Convert color fields to hex
-            self._color_fields(r)
-            result.append(r)
         # Original-Default „Ansicht > Sortierung > Name": alphabetisch nach
         # Nachname, dann Vorname (Wine-Orakel; POSITION entspricht dem dortigen
         # Modus „Vorgabe" und bleibt als Feld erhalten).
-        result.sort(
+        rows = self._presented(
+            "EMPL",
+            self._prepare_employee,
             key=lambda x: (
                 (x.get("NAME") or "").lower(),
                 (x.get("FIRSTNAME") or "").lower(),
                 x.get("POSITION") or 0,
-            )
+            ),
         )
-        return result
+        return [r for r in rows if include_hidden or not r.get("HIDE")]
+
+    @staticmethod
+    def _prepare_employee(r: dict) -> None:
+        """WORKDAYS_LIST und (ggf. generiertes) SHORTNAME an *r* ergänzen."""
+        # Parse WORKDAYS: stored as plain ASCII "1 1 1 1 1 0 0 0"
+        # (dbf_reader now correctly decodes ASCII vs UTF-16 LE fields)
+        wd = r.get("WORKDAYS", "")
+        if wd:
+            r["WORKDAYS_LIST"] = [x == "1" for x in wd.split()]
+        else:
+            r["WORKDAYS_LIST"] = []
+        # Auto-generate SHORTNAME if empty:
+        # Format: Vorname-Initial + erste 2 Buchstaben Nachname (uppercase)
+        # e.g. "Hans Mueller" → "HMU"  (H from Hans, MU from Mueller)
+        original_shortname = (r.get("SHORTNAME") or "").strip()
+        if not original_shortname:
+            surname = (r.get("NAME", "") or "").strip()
+            firstname = (r.get("FIRSTNAME", "") or "").strip()
+            if firstname and surname:
+                r["SHORTNAME"] = (firstname[0] + surname[:2]).upper()
+            elif surname:
+                r["SHORTNAME"] = surname[:3].upper()
+            elif firstname:
+                r["SHORTNAME"] = firstname[:3].upper()
+            else:
+                r["SHORTNAME"] = "???"
+            r["SHORTNAME_GENERATED"] = True  # flag: was auto-generated, not stored in DB
+        else:
+            r["SHORTNAME"] = original_shortname
+            r["SHORTNAME_GENERATED"] = False
 
     def get_employee(self, emp_id: int) -> dict | None:
         """Return a single employee by ID, or None if not found."""
@@ -401,13 +532,8 @@ class SP5Database:
     # ── Groups ─────────────────────────────────────────────────
     def get_groups(self, include_hidden: bool = False) -> list[dict]:
         """Liefert die Gruppen, optional inklusive versteckter."""
-        rows = self._read("GROUP")
-        if not include_hidden:
-            rows = [r for r in rows if not r.get("HIDE")]
-        for r in rows:
-            self._color_fields(r)
-        rows.sort(key=lambda x: x.get("POSITION", 0))
-        return rows
+        rows = self._presented("GROUP")
+        return [r for r in rows if include_hidden or not r.get("HIDE")]
 
     def get_group_members(self, group_id: int) -> list[int]:
         """Liefert die Mitarbeiter-IDs einer Gruppe."""
@@ -427,33 +553,30 @@ class SP5Database:
 
     def get_employee_groups(self, emp_id: int) -> list[int]:
         """Liefert die Gruppen-IDs, denen ein Mitarbeiter angehört."""
-        assignments = self._read("GRASG")
-        return [a["GROUPID"] for a in assignments if a.get("EMPLOYEEID") == emp_id]
+        return [a["GROUPID"] for a in self._read_by_field("GRASG").get(emp_id, ())]
 
     # ── Shifts ─────────────────────────────────────────────────
     def get_shifts(self, include_hidden: bool = False) -> list[dict]:
         """Return all shift definitions, optionally including hidden ones."""
-        rows = self._read("SHIFT")
-        if not include_hidden:
-            rows = [r for r in rows if not r.get("HIDE")]
-        for r in rows:
-            self._color_fields(r)
-            # Parse STARTEND per weekday
-            times: dict[int, Any] = {}
-            for i in range(7):
-                key = f"STARTEND{i}"
-                val = r.get(key, "").strip()
-                if val and "-" in val:
-                    parts = val.split("-")
-                    if len(parts) == 2:
-                        times[i] = {"start": parts[0].strip(), "end": parts[1].strip()}
-                    else:
-                        times[i] = None  # type: ignore[assignment]
+        rows = self._presented("SHIFT", self._prepare_shift)
+        return [r for r in rows if include_hidden or not r.get("HIDE")]
+
+    @staticmethod
+    def _prepare_shift(r: dict) -> None:
+        """STARTEND0..6 als TIMES_BY_WEEKDAY an *r* ergänzen."""
+        times: dict[int, Any] = {}
+        for i in range(7):
+            key = f"STARTEND{i}"
+            val = r.get(key, "").strip()
+            if val and "-" in val:
+                parts = val.split("-")
+                if len(parts) == 2:
+                    times[i] = {"start": parts[0].strip(), "end": parts[1].strip()}
                 else:
                     times[i] = None  # type: ignore[assignment]
-            r["TIMES_BY_WEEKDAY"] = times
-        rows.sort(key=lambda x: x.get("POSITION", 0))
-        return rows
+            else:
+                times[i] = None  # type: ignore[assignment]
+        r["TIMES_BY_WEEKDAY"] = times
 
     def get_shift(self, shift_id: int) -> dict | None:
         """Return a single shift definition by ID, or None if not found."""
@@ -465,13 +588,8 @@ class SP5Database:
     # ── Leave Types ────────────────────────────────────────────
     def get_leave_types(self, include_hidden: bool = False) -> list[dict]:
         """Return all leave/absence type definitions."""
-        rows = self._read("LEAVT")
-        if not include_hidden:
-            rows = [r for r in rows if not r.get("HIDE")]
-        for r in rows:
-            self._color_fields(r)
-        rows.sort(key=lambda x: x.get("POSITION", 0))
-        return rows
+        rows = self._presented("LEAVT")
+        return [r for r in rows if include_hidden or not r.get("HIDE")]
 
     def get_leave_type(self, lt_id: int) -> dict | None:
         """Return a single leave type by ID, or None if not found."""
@@ -483,13 +601,8 @@ class SP5Database:
     # ── Workplaces ─────────────────────────────────────────────
     def get_workplaces(self, include_hidden: bool = False) -> list[dict]:
         """Return all workplace definitions."""
-        rows = self._read("WOPL")
-        if not include_hidden:
-            rows = [r for r in rows if not r.get("HIDE")]
-        for r in rows:
-            self._color_fields(r)
-        rows.sort(key=lambda x: x.get("POSITION", 0))
-        return rows
+        rows = self._presented("WOPL")
+        return [r for r in rows if include_hidden or not r.get("HIDE")]
 
     # ── Holidays ───────────────────────────────────────────────
     def get_holidays(self, year: int | None = None) -> list[dict]:
@@ -514,8 +627,7 @@ class SP5Database:
                     result.append(r)
             result.sort(key=lambda x: x.get("DATE", ""))
             return result
-        rows.sort(key=lambda x: x.get("DATE", ""))
-        return rows
+        return sorted(rows, key=lambda x: x.get("DATE", ""))
 
     def get_holiday_dates(self, year: int) -> set:
         return {r["DATE"] for r in self.get_holidays(year) if r.get("DATE")}
@@ -1652,7 +1764,7 @@ class SP5Database:
         """
         filepath = self._table("CYASS")
         fields = get_table_fields(filepath)
-        existing = read_dbf(filepath)
+        existing = read_dbf(filepath, fields=["ID"])
         max_id = max((r.get("ID", 0) or 0 for r in existing), default=0)
         new_id = max_id + 1
         record = {
@@ -2290,12 +2402,18 @@ class SP5Database:
                 shifts_by_group.setdefault(gid, set()).add(sid)
 
         spdem_by_cell: dict[tuple[int, str, int], dict] = {}
+        spdem_shifts: dict[tuple[int, str], set[int]] = {}
         for r in self._read("SPDEM"):
             gid = r.get("GROUPID") or 0
             sid = int(r.get("SHIFTID") or 0)
             d = r.get("DATE") or ""
             if sid and d:
                 spdem_by_cell[(gid, d, sid)] = r
+                spdem_shifts.setdefault((gid, d), set()).add(sid)
+        # Regel-Schichten je Gruppe einmal sortieren; je Tag wird nur bei
+        # Sonderbedarf an diesem Tag neu gemischt (statt Kopie + Sortierung
+        # + Scan über alle 5SPDEM-Zellen je Tag und Gruppe).
+        base_shift_ids = {gid: sorted(sids) for gid, sids in shifts_by_group.items()}
 
         manual = self._movement_by_employee("MASHI", von, bis)
         special = self._movement_by_employee("SPSHI", von, bis)
@@ -2338,11 +2456,11 @@ class SP5Database:
             for gid in group_ids:
                 demands = shdem_by_group.get(gid, [])
                 member_entries = member_entries_by_group.get(gid, {})
-                shift_ids = set(shifts_by_group.get(gid, set()))
-                shift_ids.update(
-                    sid for (g, dd, sid) in spdem_by_cell if g == gid and dd == iso
-                )
-                for sid in sorted(shift_ids):
+                shift_ids = base_shift_ids.get(gid, [])
+                extra = spdem_shifts.get((gid, iso))
+                if extra:
+                    shift_ids = sorted(extra.union(shift_ids))
+                for sid in shift_ids:
                     spdem = spdem_by_cell.get((gid, iso, sid))
                     if spdem is not None:
                         mn, mx = int(spdem.get("MIN") or 0), int(spdem.get("MAX") or 0)
@@ -2731,6 +2849,11 @@ class SP5Database:
         inputs = self._calc_inputs(von, bis)
         lt_map = inputs["leave_types_by_id"]
         lo, hi = von.isoformat(), bis.isoformat()
+        # Einmal je Abwesenheitsart statt je Abwesenheit klassifizieren.
+        # Urlaub: nur ENTITLED=1 zählt aufs Kontingent (CHARGETYP=1 allein,
+        # z. B. Krankheit, zählt NICHT als Urlaub); krank: per Namens-Stichwort.
+        vac_ids = {lt_id for lt_id, lt in lt_map.items() if lt.get("ENTITLED")}
+        sick_ids = {lt_id for lt_id, lt in lt_map.items() if self._is_sick_leave_type(lt)}
 
         result = []
         for emp in employees:
@@ -2762,19 +2885,10 @@ class SP5Database:
             abs_days = len(absences)
             vac = sick = 0
             for r in absences:
-                lt = lt_map.get(r.get("LEAVETYPID"))
-                if lt is None:
-                    continue
-                # Vacation: only ENTITLED=1 types count against leave quota
-                # (CHARGETYP=1 alone, e.g. Krankheit, must NOT count as vacation)
-                if lt.get("ENTITLED"):
+                lt_id = r.get("LEAVETYPID")
+                if lt_id in vac_ids:
                     vac += 1
-                # Sick: detect by name keyword
-                lt_name = (lt.get("NAME", "") or "").lower()
-                lt_short = (lt.get("SHORTNAME", "") or "").lower()
-                if any(
-                    kw in lt_name or kw in lt_short for kw in ["krank", "sick", "ku"]
-                ):
+                if lt_id in sick_ids:
                     sick += 1
 
             result.append(
@@ -3017,11 +3131,10 @@ class SP5Database:
         """
         from datetime import timedelta
 
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
+        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
         monday = dt - timedelta(days=dt.weekday())
-        week_dates = [
-            (monday + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)
-        ]
+        week_days = [monday + timedelta(days=i) for i in range(7)]
+        week_dates = [d.isoformat() for d in week_days]
 
         employees = self.get_employees(include_hidden=False)
         if group_id is not None:
@@ -3041,9 +3154,7 @@ class SP5Database:
 
         # Unmaterialisierte Zyklusdienste (5CYASS, Spec 6.3/4.2) als Basis —
         # 5MASHI/5SPSHI/5ABSEN überschreiben sie in den folgenden Schleifen.
-        week_von = date.fromisoformat(week_dates[0])
-        week_bis = date.fromisoformat(week_dates[6])
-        for eid, recs in self._cycle_shifts_by_employee(week_von, week_bis).items():
+        for eid, recs in self._cycle_shifts_by_employee(week_days[0], week_days[6]).items():
             if eid not in allowed_ids:
                 continue
             for r in recs:
@@ -3509,7 +3620,7 @@ class SP5Database:
         """Append a note to 5NOTE."""
         filepath = self._table("NOTE")
         fields = get_table_fields(filepath)
-        existing = read_dbf(filepath)
+        existing = read_dbf(filepath, fields=["ID"])
         max_id = max((r.get("ID", 0) or 0 for r in existing), default=0)
         new_id = max_id + 1
         # TEXT1/TEXT2: C len=252 bytes, UTF-16-LE → 125 chars max
@@ -4422,11 +4533,19 @@ class SP5Database:
         if not raw:
             return ""
         try:
-            decoded = raw.encode("utf-16-le").decode("latin1", errors="replace").strip()
-            return decoded.replace("\x00", "").replace("\t", "").strip()
+            # NUL-/Tab-Bytes in einem translate()-Durchlauf löschen, bevor
+            # latin-1 (1:1 Byte → Zeichen) dekodiert
+            return raw.encode("utf-16-le").translate(None, b"\x00\t").decode("latin1").strip()
         except Exception:
             return ""
 
+    @staticmethod
+    def _is_sick_leave_type(lt: dict) -> bool:
+        """Krankheits-Abwesenheitsart am Stichwort in NAME/SHORTNAME erkennen."""
+        name = (lt.get("NAME") or "").lower()
+        short = (lt.get("SHORTNAME") or "").lower()
+        return any(kw in name or kw in short for kw in _SICK_KEYWORDS)
+
     @staticmethod
     def _time_str_to_minutes(time_str: str) -> int | None:
         """Convert 'HH:MM' to minutes from midnight, or None if invalid."""
@@ -4435,29 +4554,6 @@ class SP5Database:
             return int(parts[0]) * 60 + int(parts[1])
         return None
 
-    @staticmethod
-    def _interval_overlap_minutes(
-        a_start: int, a_end: int, b_start: int, b_end: int
-    ) -> int:
-        """Calculate overlap in minutes between two simple (non-wrapping) time intervals."""
-        return max(0, min(a_end, b_end) - max(a_start, b_start))
-
-    def _get_shift_time_range(
-        self, shift: dict, weekday: int
-    ) -> tuple[int | None, int | None, float]:
-        """Return (start_min, end_min, duration_h) for a shift on given weekday."""
-        raw = shift.get(f"STARTEND{weekday}", "")
-        decoded = self._decode_startend(raw)
-        if decoded and "-" in decoded:
-            parts = decoded.split("-", 1)
-            start_m = self._time_str_to_minutes(parts[0].strip())
-            end_m = self._time_str_to_minutes(parts[1].strip())
-            if start_m is not None and end_m is not None:
-                duration = float(shift.get(f"DURATION{weekday}", 0) or 0)
-                return start_m, end_m, duration
-        duration = float(shift.get(f"DURATION{weekday}", 0) or 0)
-        return None, None, duration
-
     def calculate_extracharge_hours(
         self,
         year: int | None = None,
@@ -4696,7 +4792,7 @@ class SP5Database:
         fields = get_table_fields(filepath)
 
         # Read max ID before deletion
-        all_records = read_dbf(filepath)
+        all_records = read_dbf(filepath, fields=["ID"])
         max_id = max((r.get("ID", 0) or 0 for r in all_records), default=0)
 
         # Remove existing entries for this employee+year(+leave_type)
@@ -4736,25 +4832,57 @@ class SP5Database:
         Ohne 5LEAEN-Satz gibt es keinen Default-Anspruch (das Original zeigt
         dann keinen Anspruch).
         """
-        emp = self.get_employee(employee_id)
+        return self.get_leave_balances(year, [employee_id])[employee_id]
+
+    def get_leave_balances(self, year: int, employee_ids: Iterable[int]) -> dict[int, dict]:
+        """Urlaubskonten mehrerer Mitarbeiter in einem Durchgang ({id: balance}).
+
+        Batch-Variante von :meth:`get_leave_balance` (gleiches Ergebnis je ID):
+        Mitarbeiterstamm, Feiertage, Abwesenheitsarten und die 5LEAEN-/5ABSEN-
+        Indizes werden einmal gelesen statt einmal je Mitarbeiter.
+        """
+        emp_map: dict[int, dict] = {}
+        for e in self.get_employees(include_hidden=True):
+            emp_map.setdefault(e.get("ID"), e)
+        holidays = self._calc_holidays()
+        entitled_types = [
+            lt for lt in self.get_leave_types(include_hidden=True) if lt.get("ENTITLED")
+        ]
+        leaen_index = self._read_by_field("LEAEN")
+        absen_index = self._read_by_field("ABSEN")
+        return {
+            eid: self._leave_balance(
+                eid,
+                year,
+                emp_map.get(eid),
+                holidays,
+                entitled_types,
+                list(leaen_index.get(eid, ())),
+                list(absen_index.get(eid, ())),
+            )
+            for eid in employee_ids
+        }
+
+    def _leave_balance(
+        self,
+        employee_id: int,
+        year: int,
+        emp: dict | None,
+        holidays: dict[date, int],
+        entitled_types: list[dict],
+        leaen_rows: list[dict],
+        absences: list[dict],
+    ) -> dict:
+        """Urlaubskonto eines Mitarbeiters aus bereits gelesenen Eingaben."""
         ctx = (
             self._calc_context(emp)
             if emp
             else calc.EmployeeContext(workdays=(False,) * 8)
         )
-        holidays = self._calc_holidays()
-        leaen_rows = [
-            r for r in self._read("LEAEN") if r.get("EMPLOYEEID") == employee_id
-        ]
-        absences = [
-            r for r in self._read("ABSEN") if r.get("EMPLOYEEID") == employee_id
-        ]
 
         total_entitlement = total_carry = used = 0.0
         by_type = []
-        for lt in self.get_leave_types(include_hidden=True):
-            if not lt.get("ENTITLED"):
-                continue
+        for lt in entitled_types:
             acct = calc.leave_account(
                 ctx,
                 year,
@@ -4802,12 +4930,12 @@ class SP5Database:
         """Get leave balance for all employees in a group."""
         member_ids = self.get_group_members(group_id)
         emp_map = {e["ID"]: e for e in self.get_employees(include_hidden=True)}
+        member_ids = [eid for eid in member_ids if emp_map.get(eid)]
+        balances = self.get_leave_balances(year, member_ids)
         result = []
         for eid in member_ids:
-            emp = emp_map.get(eid)
-            if not emp:
-                continue
-            balance = self.get_leave_balance(eid, year)
+            emp = emp_map[eid]
+            balance = balances[eid]
             balance["employee_name"] = (
                 f"{emp.get('NAME', '')}, {emp.get('FIRSTNAME', '')}".strip(", ")
             )
@@ -4847,7 +4975,7 @@ class SP5Database:
         """Create a holiday ban entry."""
         filepath = self._table("HOBAN")
         fields = get_table_fields(filepath)
-        existing = read_dbf(filepath)
+        existing = read_dbf(filepath, fields=["ID"])
         max_id = max((r.get("ID", 0) or 0 for r in existing), default=0)
         new_id = max_id + 1
         record = {
@@ -4926,8 +5054,8 @@ class SP5Database:
         ctx = self._calc_context(emp)
         holidays = self._calc_holidays()
         leave_types = self.get_leave_types(include_hidden=True)
-        leaen_rows = [r for r in self._read("LEAEN") if r.get("EMPLOYEEID") == eid]
-        absences = [r for r in self._read("ABSEN") if r.get("EMPLOYEEID") == eid]
+        leaen_rows = list(self._read_by_field("LEAEN").get(eid, ()))
+        absences = list(self._read_by_field("ABSEN").get(eid, ()))
 
         new_rows = calc.annual_close(
             ctx,
@@ -5030,10 +5158,10 @@ class SP5Database:
             member_ids = set(self.get_group_members(group_id))
             employees = [e for e in employees if e["ID"] in member_ids]
         next_year = year + 1
+        leaen = self._read_by_field("LEAEN")
         for emp in employees[:3]:  # check first few employees only
-            rows = self._read("LEAEN")
-            for r in rows:
-                if r.get("EMPLOYEEID") == emp["ID"] and r.get("YEAR") == next_year:
+            for r in leaen.get(emp["ID"], ()):
+                if r.get("YEAR") == next_year:
                     return True
         return False
 
@@ -5273,7 +5401,7 @@ class SP5Database:
         """Append a new manual booking to 5BOOK.DBF."""
         filepath = self._table("BOOK")
         fields = get_table_fields(filepath)
-        existing = read_dbf(filepath)
+        existing = read_dbf(filepath, fields=["ID"])
         max_id = max((r.get("ID", 0) or 0 for r in existing), default=0)
         new_id = max_id + 1
         record = {
@@ -5360,10 +5488,9 @@ class SP5Database:
         wirkt dadurch regulär über GetActualHours auf den Saldo.
         """
         target_date = f"{year}-01-01"
-        for r in self._read("BOOK"):
+        for r in self._read_by_field("BOOK").get(employee_id, ()):
             if (
-                r.get("EMPLOYEEID") == employee_id
-                and int(r.get("TYPE") or 0) == calc.BOOKING_ACTUAL
+                int(r.get("TYPE") or 0) == calc.BOOKING_ACTUAL
                 and r.get("DATE") == target_date
                 and str(r.get("NOTE") or "").startswith(self._CARRY_FORWARD_NOTE)
             ):
@@ -5393,7 +5520,13 @@ class SP5Database:
         year_str = str(year)
         # Delete existing carry-forward entries (TYPE=0 new style and TYPE=2
         # legacy style, both identified by the NOTE marker) for this year.
-        existing = read_dbf(filepath)
+        # NOTE fehlt in manchen Schichtplaner5-Versionen — nur vorhandene Felder
+        # projizieren, sonst bricht die Projektion mit "Unbekannte Felder" ab.
+        field_names = {f["name"] for f in fields}
+        existing = read_dbf(
+            filepath,
+            fields=[n for n in ("ID", "EMPLOYEEID", "DATE", "NOTE") if n in field_names],
+        )
         for r in existing:
             if r.get("EMPLOYEEID") != employee_id:
                 continue
@@ -5407,7 +5540,7 @@ class SP5Database:
                     if raw_idx is not None:
                         delete_record(filepath, fields, raw_idx)
         # Append new carry-forward (Iststundenkonto, Spec 3.6.2 Nr. 6)
-        existing2 = read_dbf(filepath)
+        existing2 = read_dbf(filepath, fields=["ID"])
         max_id = max((r.get("ID", 0) or 0 for r in existing2), default=0)
         new_id = max_id + 1
         date_str = f"{year}-01-01"
@@ -5986,17 +6119,19 @@ class SP5Database:
             }
 
         # Belegung des Tages: 5MASHI + 5SPSHI (eingeteilt), 5ABSEN (abwesend).
-        busy_by_emp: dict[int, set[date]] = {}
-        for table in ("MASHI", "SPSHI"):
-            for r in self._read(table):
-                rd = calc.to_date(r.get("DATE"))
-                if rd is not None:
-                    busy_by_emp.setdefault(r.get("EMPLOYEEID"), set()).add(rd)
-        absent_by_emp: dict[int, set[date]] = {}
-        for r in self._read("ABSEN"):
-            rd = calc.to_date(r.get("DATE"))
-            if rd is not None:
-                absent_by_emp.setdefault(r.get("EMPLOYEEID"), set()).add(rd)
+        # Nur der eine Tag zählt — über den Monatsindex statt Volltabellen-
+        # Scan mit Datums-Parse je Zeile; DATE ist ISO-zero-padded.
+        iso = d.isoformat()
+
+        def on_day(table: str) -> set[int]:
+            return {
+                r.get("EMPLOYEEID")
+                for r in self._read_by_month(table).get(iso[:7], ())
+                if r.get("DATE") == iso
+            }
+
+        busy_ids = on_day("MASHI") | on_day("SPSHI")
+        absent_ids = on_day("ABSEN")
 
         restr_by_emp: dict[int, list[dict]] = {}
         for r in self._read("RESTR"):
@@ -6015,8 +6150,8 @@ class SP5Database:
                 holidays,
                 is_hidden=bool(emp.get("HIDE")),
                 in_group=(allowed_ids is None) or (eid in allowed_ids),
-                busy_dates=busy_by_emp.get(eid, set()),
-                absent_dates=absent_by_emp.get(eid, set()),
+                busy_dates=(d,) if eid in busy_ids else (),
+                absent_dates=(d,) if eid in absent_ids else (),
                 restrictions=restr_by_emp.get(eid, []),
             )
             if not ok:
@@ -6180,8 +6315,7 @@ class SP5Database:
         """Update global settings in 5USETT.DBF (record 0)."""
         filepath = self._table("USETT")
         fields = get_table_fields(filepath)
-        rows = read_dbf(filepath)
-        if not rows:
+        if not count_records(filepath):
             raise ValueError("5USETT.DBF is empty — cannot update settings")
         # Find raw index of record with ID=0 (global settings row)
         matches = find_all_records(filepath, fields, ID=0)
@@ -7080,12 +7214,7 @@ class SP5Database:
         """
         # Identify sick leave type IDs
         leavt = self.get_leave_types(include_hidden=True)
-        sick_ids: set = set()
-        for lt in leavt:
-            name = (lt.get("NAME", "") or "").lower()
-            short = (lt.get("SHORTNAME", "") or "").lower()
-            if any(kw in name or kw in short for kw in ["krank", "sick", "ku"]):
-                sick_ids.add(lt["ID"])
+        sick_ids = {lt["ID"] for lt in leavt if self._is_sick_leave_type(lt)}
 
         year_str = str(year)
 
@@ -7133,10 +7262,11 @@ class SP5Database:
         per_month = [0] * 13  # index 1-12
         per_weekday = [0] * 7  # index 0=Mon … 6=Sun
 
+        # DATE kommt ISO-formatiert aus dem Reader: fromisoformat statt strptime.
         for ab in sick_abs:
             date_str = ab.get("DATE", "") or ""
             try:
-                d = datetime.strptime(date_str, "%Y-%m-%d")
+                d = date.fromisoformat(date_str)
                 per_month[d.month] += 1
                 per_weekday[d.weekday()] += 1
             except ValueError:
@@ -7153,9 +7283,9 @@ class SP5Database:
             episodes = 0
             if dates_sorted:
                 episodes = 1
-                prev_d = datetime.strptime(dates_sorted[0], "%Y-%m-%d")
+                prev_d = date.fromisoformat(dates_sorted[0])
                 for d_str in dates_sorted[1:]:
-                    d = datetime.strptime(d_str, "%Y-%m-%d")
+                    d = date.fromisoformat(d_str)
                     if (d - prev_d).days > 3:  # gap > 3 calendar days = new episode
                         episodes += 1
                     prev_d = d
@@ -7539,7 +7669,7 @@ class SP5Database:
         partner_id: int,
         partner_date: str,
         note: str = "",
-        status: str = "pending",
+        status: SwapStatus = "pending",
         created_by: str = "system",
     ) -> dict:
         import datetime as _dt
@@ -7554,7 +7684,7 @@ class SP5Database:
             "partner_id": partner_id,
             "partner_date": partner_date,
             "note": note,
-            "status": status,  # pending_partner | pending | approved | rejected | cancelled | expired
+            "status": status,
             "partner_accepted": None if status == "pending_partner" else True,
             "created_at": now,
             "resolved_at": None,
@@ -7576,7 +7706,7 @@ class SP5Database:
     def _add_status_history(
         self,
         entry: dict,
-        new_status: str,
+        new_status: SwapStatus,
         changed_by: str,
         reason: str = "",
     ) -> None:
@@ -7636,7 +7766,7 @@ class SP5Database:
     def resolve_swap_request(
         self,
         swap_id: int,
-        action: str,
+        action: Literal["approve", "reject"],
         resolved_by: str = "planner",
         reject_reason: str = "",
     ) -> dict | None:
@@ -7679,7 +7809,7 @@ class SP5Database:
         entries = self._load_swap_requests()
         expired_ids: list[int] = []
         for entry in entries:
-            if entry.get("status") not in ("pending", "pending_partner"):
+            if entry.get("status") not in _OPEN_SWAP_STATUSES:
                 continue
             created_raw = entry.get("created_at", "")
             try:
@@ -3,9 +3,12 @@ Reiner Python-Reader für die DBF/dBASE-Dateien von Schichtplaner5.
 Behandelt die UTF-16-LE-Textkodierung der Delphi/FoxPro-Anwendung.
 """
 
-import io
+import os
 import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import date
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 #: Binäre C-Felder (Spec D-21): der Inhalt sind rohe Bytes, kein Text. Sie
@@ -17,6 +20,30 @@ from typing import Any
 BINARY_C_FIELDS = {"DIGEST", "CREATIME", "UUID"}
 
 
+def _prefetch(paths: Iterable[str]) -> None:
+    """Dem Kernel ankündigen, dass *paths* gleich vollständig gelesen werden.
+
+    ``POSIX_FADV_WILLNEED`` stößt das Einlesen aller Dateien sofort und
+    parallel an; bei kaltem Page-Cache (Netzpfad, frisch gemountet) überlappt
+    so die Platten-I/O der folgenden Tabellen mit dem Parsen der ersten.
+    Nur ein Hinweis: ohne ``posix_fadvise`` (Windows, macOS) oder bei
+    fehlenden Dateien passiert nichts.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
 def _dedupe_names(names: list[str]) -> list[str]:
     """Doppelte Feldnamen positionsbasiert eindeutig machen.
 
@@ -37,6 +64,11 @@ def _dedupe_names(names: list[str]) -> list[str]:
     return result
 
 
+#: Löschtabelle für :func:`_is_utf16_le`: alle Bytes, die kein UTF-16-High-Byte
+#: (0x00..0x07) sein können.
+_NON_HIGH_BYTES = bytes(range(0x08, 0x100))
+
+
 def _is_utf16_le(raw: bytes) -> bool:
     """
     Heuristik: erkennt, ob rohe Bytes UTF-16-LE-kodierter Text sind.
@@ -53,11 +85,11 @@ def _is_utf16_le(raw: bytes) -> bool:
     if len(raw) < 4:
         # Sehr kurzes Feld — prüfen, ob das zweite Byte ein UTF-16-High-Byte ist
         return len(raw) >= 2 and raw[1] < 0x08
-    # Für die Erkennung bis zu 8 Bytes betrachten
-    sample_len = min(8, len(raw))
-    sample = raw[:sample_len]
-    odd_bytes = sample[1::2]
-    high_count = sum(1 for b in odd_bytes if b < 0x08)
+    # Für die Erkennung bis zu 8 Bytes betrachten (ungerade Positionen 1..7)
+    odd_bytes = raw[1:8:2]
+    # High-Bytes zählen: alle anderen per translate() löschen (eine C-Schleife
+    # statt eines Generators je Feld und Datensatz)
+    high_count = len(odd_bytes.translate(None, _NON_HIGH_BYTES))
     # Mehr als die Hälfte der ungeraden Bytes sind High-Bytes → UTF-16 LE
     return high_count > len(odd_bytes) // 2
 
@@ -72,17 +104,20 @@ def _decode_string(raw: bytes) -> str:
 
     UTF-16 LE wird über die 0x00-Bytes an ungeraden Positionen erkannt.
     """
-    if not raw:
+    # Leere Felder (nur Füll-Leerzeichen/Nullen) sind häufig — sofort "" ohne
+    # Kodierungs-Heuristik; beide Dekodierpfade lieferten dafür ebenfalls "".
+    stripped = raw.rstrip(b"\x00\x20")
+    if not stripped:
         return ""
 
     if _is_utf16_le(raw):
-        # UTF-16-LE-Text: Null-Terminator suchen (0x00 0x00 an gerader Position)
-        end = len(raw)
-        for i in range(0, len(raw) - 1, 2):
-            if raw[i] == 0x00 and raw[i + 1] == 0x00:
-                end = i
-                break
-        chunk = raw[:end]
+        # UTF-16-LE-Text: Null-Terminator suchen (0x00 0x00 an gerader
+        # Position) — per bytes.find in C; ein Treffer an ungerader Position
+        # (Ende eines Zeichens + Anfang des nächsten) wird übersprungen.
+        end = raw.find(b"\x00\x00")
+        while end > 0 and end & 1:
+            end = raw.find(b"\x00\x00", end + 1)
+        chunk = raw[:end] if end >= 0 else raw
         if not chunk:
             return ""
         try:
@@ -91,16 +126,39 @@ def _decode_string(raw: bytes) -> str:
             pass
 
     # Reines ASCII-/Binär-Datenfeld (WORKDAYS, STARTEND*, …): abschließende
-    # Leerzeichen/Nullen strippen und als latin-1 dekodieren (erhält alle Bytewerte)
-    stripped = raw.rstrip(b"\x00\x20")
-    try:
-        return stripped.decode("latin-1").strip()
-    except Exception:
-        return raw.split(b"\x00")[0].decode("latin-1", errors="replace").strip()
+    # Leerzeichen/Nullen gestrippt (oben) und als latin-1 dekodiert (erhält
+    # alle Bytewerte, kann also nicht fehlschlagen)
+    return stripped.decode("latin-1").strip()
+
+
+def _parse_descriptor(field_data: bytes) -> dict[str, Any]:
+    """Einen 32-Byte-Felddeskriptor in ``{name, type, len, dec}`` übersetzen."""
+    name = field_data[0:11].split(b"\x00")[0].decode("ascii", errors="replace").strip()
+    return {
+        "name": name,
+        "type": chr(field_data[11]),
+        "len": field_data[16],
+        "dec": field_data[17],
+    }
 
 
-def _parse_date(raw: str) -> str | None:
-    """Parst einen dBASE-Datumsstring YYYYMMDD ins ISO-Format.
+def _parse_descriptors(block: bytes) -> list[dict[str, Any]]:
+    """Alle Felddeskriptoren aus dem Headerbereich hinter den ersten 32 Bytes.
+
+    *block* sind die Bytes 32 … ``header_size`` (Header-Länge aus Offset 8),
+    also in einem Stück gelesen statt je Deskriptor ein ``read(32)``. Das
+    Ende markiert 0x0D (oder das Ende des Blocks).
+    """
+    descriptors = []
+    for pos in range(0, len(block) - 31, 32):
+        if block[pos] == 0x0D:
+            break
+        descriptors.append(_parse_descriptor(block[pos : pos + 32]))
+    return descriptors
+
+
+def _parse_date(raw: str | bytes) -> str | None:
+    """Parst einen dBASE-Datumswert YYYYMMDD (``str`` oder Rohbytes) ins ISO-Format.
 
     Liefert None für alles, was kein reales Kalenderdatum ist. Die volle
     Kalender-Validierung (über :class:`datetime.date`) weist unmögliche Daten
@@ -108,90 +166,213 @@ def _parse_date(raw: str) -> str | None:
     durchließ und die später ``date.fromisoformat`` hätten crashen lassen.
     """
     s = raw.strip()
-    if len(s) == 8 and s.isdigit():
-        try:
-            year, month, day = int(s[:4]), int(s[4:6]), int(s[6:8])
-            if year > 0:
-                # date() validiert Monat/Tag für das jeweilige Jahr beim Konstruieren.
-                return date(year, month, day).isoformat()
-        except ValueError:
-            pass
+    if len(s) != 8 or not s.isdigit():
+        return None
+    try:
+        # date() prüft Jahr (>= 1), Monat und Tag in einem Aufruf; int()
+        # nimmt auch bytes, die Rohbytes müssen also nicht dekodiert werden.
+        return date(int(s[:4]), int(s[4:6]), int(s[6:8])).isoformat()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _convert_date(chunk: bytes) -> str | None:
+    """D-Feld: YYYYMMDD → ISO-Datum (siehe :func:`_parse_date`).
+
+    Gecacht: Dienstplan- und Abwesenheitstabellen wiederholen dieselben
+    wenigen hundert Tage tausendfach; ein Treffer ist ein dict-Lookup statt
+    Dekodieren, Zerlegen und ``date``-Konstruktion. Die Rohbytes sind
+    unveränderlich, der Cache ist durch *maxsize* begrenzt.
+    """
+    return _parse_date(chunk)
+
+
+# Die Zahlen- und Logik-Konverter arbeiten direkt auf den Rohbytes: int()
+# und float() parsen bytes in C, ein ASCII-Dekodieren je Zelle entfällt.
+# Nicht-ASCII-Bytes scheitern dort genauso (→ 0) wie nach dem früheren
+# Dekodieren mit errors="replace".
+def _convert_number(chunk: bytes) -> int | float:
+    """N/F-Feld ohne Nachkommastellen: int, mit Dezimalpunkt float, leer → 0."""
+    s = chunk.strip()
+    if s == b"" or s == b".":
+        return 0
+    try:
+        # 0x2E = "."; die int-Suche ist deutlich billiger als b"." in s
+        return float(s) if 0x2E in s else int(s)
+    except ValueError:
+        return 0
+
+
+def _convert_decimal(chunk: bytes) -> int | float:
+    """N/F-Feld mit Nachkommastellen (dec > 0): immer float, leer → 0."""
+    s = chunk.strip()
+    if s == b"" or s == b".":
+        return 0
+    try:
+        return float(s)
+    except ValueError:
+        return 0
+
+
+def _convert_logical(chunk: bytes) -> bool:
+    """L-Feld: T/t/Y/y/1 → True, alles andere False."""
+    return chunk.strip() in (b"T", b"t", b"Y", b"y", b"1")
+
+
+def _convert_memo(chunk: bytes) -> None:
+    """M-Feld: nur Zeiger in der .DBF, eigentliche Daten in der .DBT."""
     return None
 
 
-# Vorberechnete Feld-Spezifikation: (dict-Schlüssel, Typ, Länge, Nachkomma,
-# Binärfeld?, Startoffset). Wird je Tabelle EINMAL erstellt und für alle
-# Datensätze wiederverwendet — spart die früher pro Datensatz wiederholten
-# int()/str()/Set-Lookups (messbarer Gewinn beim Parsen großer Tabellen).
-def _compile_field_specs(
-    fields: list[dict], names: list[str]
-) -> list[tuple[str, str, int, int, bool, int]]:
-    specs: list[tuple[str, str, int, int, bool, int]] = []
+@lru_cache(maxsize=4096)
+def _convert_text(chunk: bytes) -> str:
+    """C-Feld: Text (siehe :func:`_decode_string`), gecacht je Rohwert.
+
+    Kurzbezeichnungen, Zeitfenster (STARTEND) und Namen wiederholen sich über
+    tausende Datensätze; ein Treffer spart Kodierungs-Heuristik, Terminator-
+    Suche und Dekodieren. Seltene Einzelwerte verdrängt das begrenzte LRU.
+    """
+    return _decode_string(chunk)
+
+
+def _convert_ascii(chunk: bytes) -> str:
+    """Unbekannter Feldtyp: ASCII-Text, gestrippt."""
+    return chunk.decode("ascii", errors="replace").strip()
+
+
+#: Konverter je DBF-Feldtyp. C-Felder sind UTF-16-LE- oder ASCII-Text
+#: (:func:`_convert_text`); binäre C-Felder und N/F mit Nachkommastellen
+#: wählt :func:`_compile_field_specs` gesondert. Unbekannte Typen →
+#: :func:`_convert_ascii`.
+_CONVERTERS: dict[str, Callable[[bytes], Any]] = {
+    "C": _convert_text,
+    "D": _convert_date,
+    "N": _convert_number,
+    "F": _convert_number,
+    "L": _convert_logical,
+    "M": _convert_memo,
+}
+
+#: Vorberechnete Feld-Spezifikation: (dict-Schlüssel, Konverter, Start, Ende).
+_FieldSpec = tuple[str, Callable[[bytes], Any], int, int]
+
+
+# Wird je Tabelle EINMAL erstellt und für alle Datensätze wiederverwendet —
+# Typ-Weiche, Binärfeld-Prüfung und Offsets sind damit aus der Schleife über
+# die Datensätze heraus; je Feld bleibt ein Slice und ein Konverter-Aufruf.
+def _compile_field_specs(fields: list[dict], names: list[str]) -> list[_FieldSpec]:
+    specs: list[_FieldSpec] = []
     offset = 1  # Lösch-Flag überspringen
     for field, fname in zip(fields, names, strict=True):
         flen = int(field["len"])
-        specs.append(
-            (
-                fname,
-                str(field["type"]),
-                flen,
-                int(field["dec"]),
-                str(field["name"]) in BINARY_C_FIELDS,
-                offset,
-            )
-        )
+        ftype = str(field["type"])
+        if ftype == "C" and str(field["name"]) in BINARY_C_FIELDS:
+            # Binärfeld (D-21): rohe Bytes, ungestrippt (ein gestrippter oder
+            # latin-1-dekodierter MD5-Digest ist unwiederbringlich verfälscht).
+            convert: Callable[[bytes], Any] = bytes
+        elif ftype in ("N", "F") and int(field["dec"]) > 0:
+            convert = _convert_decimal
+        else:
+            convert = _CONVERTERS.get(ftype, _convert_ascii)
+        specs.append((fname, convert, offset, offset + flen))
         offset += flen
     return specs
 
 
-def _parse_record_specs(
-    raw: bytes, specs: list[tuple[str, str, int, int, bool, int]]
-) -> dict[str, Any]:
+def _project_specs(specs: list[_FieldSpec], fields: Sequence[str] | None) -> list[_FieldSpec]:
+    """Feld-Specs auf *fields* (in dieser Reihenfolge) einschränken.
+
+    Nicht angeforderte Felder werden gar nicht erst dekodiert — bei breiten
+    Tabellen mit vielen UTF-16-Textfeldern der Hauptanteil der Parse-Zeit.
+    ``None`` = alle Felder. Unbekannte Namen → ``ValueError``.
+    """
+    if fields is None:
+        return specs
+    by_name = {spec[0]: spec for spec in specs}
+    missing = [name for name in fields if name not in by_name]
+    if missing:
+        raise ValueError(f"Unbekannte Felder: {', '.join(missing)}")
+    return [by_name[name] for name in fields]
+
+
+def _parse_record_specs(raw: bytes, specs: list[_FieldSpec]) -> dict[str, Any]:
     """Parst einen rohen Datensatz anhand vorberechneter Feld-Spezifikationen.
 
-    Identische Dekodierlogik wie früher in ``_parse_record`` — nur ohne die
-    je Datensatz wiederholte Ableitung der Felddaten. Binäre C-Felder
-    (``BINARY_C_FIELDS``) kommen als rohe, ungestrippte ``bytes`` zurück.
+    Binäre C-Felder (``BINARY_C_FIELDS``) kommen als rohe, ungestrippte
+    ``bytes`` zurück.
     """
-    record: dict[str, Any] = {}
-    for fname, ftype, flen, fdec, is_binary, offset in specs:
-        chunk = raw[offset : offset + flen]
-
-        val: Any = None
-        if ftype == "C":
-            if is_binary:
-                # Binärfeld (D-21): rohe Bytes, ungestrippt (ein gestrippter oder
-                # latin-1-dekodierter MD5-Digest ist unwiederbringlich verfälscht).
-                val = chunk
-            else:
-                # Zeichenfeld — UTF-16 LE in Schichtplaner5
-                val = _decode_string(chunk)
-        elif ftype == "D":
-            # Datumsfeld YYYYMMDD
-            val = _parse_date(chunk.decode("ascii", errors="replace"))
-        elif ftype in ("N", "F"):
-            # Numerisch/Float
-            s = chunk.decode("ascii", errors="replace").strip()
-            if s == "" or s == ".":
-                val = 0
-            else:
-                try:
-                    val = float(s) if "." in s or fdec > 0 else int(s)
-                except ValueError:
-                    val = 0
-        elif ftype == "L":
-            # Logisch
-            s = chunk.decode("ascii", errors="replace").strip()
-            val = s in ("T", "t", "Y", "y", "1")
-        elif ftype == "M":
-            # Memo (nur Zeiger in der .DBF, eigentliche Daten in der .DBT)
-            val = None
-        else:
-            val = chunk.decode("ascii", errors="replace").strip()
+    return {fname: convert(raw[start:end]) for fname, convert, start, end in specs}
+
 
-        record[fname] = val
+def _record_unpacker(
+    specs: list[_FieldSpec], record_size: int
+) -> Callable[[bytes | memoryview], Iterator[tuple[Any, ...]]]:
+    """Zerlegt Puffer aus ganzen Datensätzen in die Feld-Chunks je Spec.
 
-    return record
+    Ein einmal kompiliertes :class:`struct.Struct` (Lösch-Flag und nicht
+    angeforderte Felder als Füllbytes) schneidet per ``iter_unpack`` alle
+    Felder eines Datensatzes in einem C-Aufruf statt einem Slice je Feld.
+    Projektionen in anderer als der Datei-Reihenfolge werden per
+    ``itemgetter`` zurücksortiert. Passen die Specs nicht in *record_size*
+    (beschädigter Header) oder überlappen sie (doppelt angeforderte
+    Felder), wird wie bisher je Feld geschnitten.
+    """
+    order = sorted(range(len(specs)), key=lambda i: specs[i][2])
+    fmt, pos = "<x", 1
+    for i in order:
+        start, end = specs[i][2], specs[i][3]
+        if start < pos:
+            break
+        fmt += f"{start - pos}x{end - start}s"
+        pos = end
+    else:
+        if pos <= record_size:
+            unpack = struct.Struct(f"{fmt}{record_size - pos}x").iter_unpack
+            if order == sorted(order):
+                return unpack
+            pick = itemgetter(*sorted(range(len(order)), key=order.__getitem__))
+            return lambda buf: map(pick, unpack(buf))
+
+    def slice_fields(buf: bytes | memoryview) -> Iterator[tuple[Any, ...]]:
+        for pos in range(0, len(buf), record_size):
+            raw = bytes(buf[pos : pos + record_size])
+            yield tuple([raw[start:end] for _, _, start, end in specs])
+
+    return slice_fields
+
+
+def _dict_parser(specs: list[_FieldSpec]) -> Callable[[tuple[Any, ...]], dict[str, Any]]:
+    """Feld-Chunks (siehe :func:`_record_unpacker`) → dict wie :func:`_parse_record_specs`."""
+    keys = [spec[0] for spec in specs]
+    converters = [spec[1] for spec in specs]
+    return lambda chunks: {
+        k: convert(c) for k, convert, c in zip(keys, converters, chunks, strict=True)
+    }
+
+
+def _row_parser(specs: list[_FieldSpec]) -> Callable[[tuple[Any, ...]], tuple[Any, ...]]:
+    """Feld-Chunks → Werte-Tupel in Spec-Reihenfolge (für :func:`iter_dbf_rows`)."""
+    converters = [spec[1] for spec in specs]
+    return lambda chunks: tuple(
+        [convert(c) for convert, c in zip(converters, chunks, strict=True)]
+    )
+
+
+def _parse_records(
+    buf: bytes | memoryview,
+    record_size: int,
+    unpack: Callable[[bytes | memoryview], Iterator[tuple[Any, ...]]],
+    parse: Callable[[tuple[Any, ...]], Any],
+) -> Iterator[Any]:
+    """Alle Datensätze in *buf* (ganzes Vielfaches von *record_size*) parsen.
+
+    Gelöschte Datensätze (erstes Byte = 0x2A = '*') werden übersprungen; die
+    Lösch-Flags liest ein Schritt-Slice über den Puffer.
+    """
+    for flag, chunks in zip(buf[::record_size], unpack(buf), strict=True):
+        if flag != 0x2A:
+            yield parse(chunks)
 
 
 def _parse_record(
@@ -211,7 +392,9 @@ def _parse_record(
     return _parse_record_specs(raw, _compile_field_specs(fields, names))
 
 
-def read_dbf(filepath: str, encoding_hint: str = "utf-16-le") -> list[dict[str, Any]]:
+def read_dbf(
+    filepath: str, encoding_hint: str = "utf-16-le", fields: Sequence[str] | None = None
+) -> list[dict[str, Any]]:
     """
     Liest eine .DBF-Datei und liefert die Datensätze als Liste von dicts.
     Zeichenfelder werden als UTF-16 LE dekodiert (wie von Schichtplaner5
@@ -219,20 +402,123 @@ def read_dbf(filepath: str, encoding_hint: str = "utf-16-le") -> list[dict[str,
     Doppelte Feldnamen werden positionsbasiert eindeutig gemacht
     (``_dedupe_names``): das zweite ``START``-Feld von 5DADEM heißt ``START2``.
 
+    *fields* beschränkt die Datensätze auf diese Felder (Projektion, siehe
+    :func:`_project_specs`); die übrigen Felder werden nicht dekodiert.
+
     Liefert eine leere Liste, wenn die Datei fehlt, nicht lesbar oder
     beschädigt ist — Aufrufer behandeln ein leeres Ergebnis als „keine Daten"
     und dürfen nicht crashen.
     """
+    # Blockweise statt die ganze Datei in einen Puffer zu lesen: der Puffer
+    # lebt sonst neben den fertigen dicts bis zum Ende (Spitzenspeicher).
+    return list(_iter_parsed(filepath, fields, _dict_parser))
+
+
+#: Zielgröße eines Leseblocks in :func:`iter_dbf` (ganze Datensätze je read()).
+_STREAM_BLOCK_SIZE = 1 << 16
+
+
+def iter_dbf(filepath: str, fields: Sequence[str] | None = None) -> Iterator[dict[str, Any]]:
+    """Datensätze einer .DBF-Datei einzeln liefern, ohne die Tabelle zu laden.
+
+    Gleiche Dekodierung wie :func:`read_dbf`, aber als Generator über
+    blockweise gelesene Datensätze: der Speicherbedarf ist unabhängig von der
+    Tabellengröße, und ein Abbruch (``islice``, ``break``) liest den Rest der
+    Datei gar nicht erst. *fields* projiziert wie bei :func:`read_dbf`.
+    Fehlende/unlesbare Dateien liefern nichts.
+    """
+    return _iter_parsed(filepath, fields, _dict_parser)
+
+
+def iter_dbf_rows(filepath: str, fields: Sequence[str] | None = None) -> Iterator[tuple[Any, ...]]:
+    """Wie :func:`iter_dbf`, liefert aber je Datensatz nur ein Werte-Tupel.
+
+    Die Werte stehen in Feldreihenfolge — der Header (``get_table_fields``,
+    Namen per ``_dedupe_names``) bzw. *fields*. Für Aufrufer, die ohnehin
+    spaltenweise weiterverarbeiten (Export), entfällt das dict je Datensatz.
+    """
+    return _iter_parsed(filepath, fields, _row_parser)
+
+
+def _iter_parsed(
+    filepath: str,
+    fields: Sequence[str] | None,
+    parser: Callable[[list[_FieldSpec]], Callable[[tuple[Any, ...]], Any]],
+) -> Iterator[Any]:
+    """Gemeinsamer Block-Lesepfad von :func:`read_dbf`, :func:`iter_dbf` und
+    :func:`iter_dbf_rows`; *parser* baut aus den Specs den Datensatz-Parser."""
     try:
-        with open(filepath, "rb") as f:
-            data = f.read()
+        open_file = open(filepath, "rb")
     except OSError:
-        # Datei fehlt, keine Rechte, oder zwischen Existenz-Check und open gelöscht
-        return []
-    return read_dbf_buffer(data)
+        return
+    with open_file as f:
+        header = f.read(32)
+        if len(header) < 32:
+            return
+        num_records = struct.unpack_from("<I", header, 4)[0]
+        header_size = struct.unpack_from("<H", header, 8)[0]
+        record_size = struct.unpack_from("<H", header, 10)[0]
+        descriptors = _parse_descriptors(f.read(max(header_size - 32, 0)))
+        if record_size == 0:
+            return
+        specs = _compile_field_specs(
+            descriptors, _dedupe_names([str(x["name"]) for x in descriptors])
+        )
+        specs = _project_specs(specs, fields)
+        unpack = _record_unpacker(specs, record_size)
+        parse = parser(specs)
+
+        f.seek(header_size)
+        per_block = max(1, _STREAM_BLOCK_SIZE // record_size)
+        remaining = num_records
+        while remaining > 0:
+            n = min(per_block, remaining)
+            block = f.read(n * record_size)
+            complete = len(block) // record_size
+            yield from _parse_records(
+                memoryview(block)[: complete * record_size], record_size, unpack, parse
+            )
+            if complete < n:
+                return  # abgeschnittene Datei: wie read_dbf beim Kurz-Read stoppen
+            remaining -= n
+
 
+def count_records(filepath: str) -> int:
+    """Anzahl der nicht gelöschten Datensätze, ohne ein Feld zu dekodieren.
 
-def read_dbf_buffer(data: bytes) -> list[dict[str, Any]]:
+    Liest blockweise nur die Datensatzbereiche und zählt die Löschmarken
+    (erstes Byte 0x2A); liefert dasselbe wie ``len(read_dbf(filepath))``,
+    aber ohne je Datensatz ein dict zu bauen. Fehlende/unlesbare Dateien: 0.
+    """
+    try:
+        open_file = open(filepath, "rb")
+    except OSError:
+        return 0
+    with open_file as f:
+        header = f.read(32)
+        if len(header) < 32:
+            return 0
+        num_records = struct.unpack_from("<I", header, 4)[0]
+        header_size = struct.unpack_from("<H", header, 8)[0]
+        record_size = struct.unpack_from("<H", header, 10)[0]
+        if record_size == 0:
+            return 0
+        f.seek(header_size)
+        per_block = max(1, _STREAM_BLOCK_SIZE // record_size)
+        count = 0
+        remaining = num_records
+        while remaining > 0:
+            n = min(per_block, remaining)
+            block = f.read(n * record_size)
+            complete = len(block) // record_size
+            count += complete - block[0 : complete * record_size : record_size].count(0x2A)
+            if complete < n:
+                break  # abgeschnittene Datei
+            remaining -= n
+    return count
+
+
+def read_dbf_buffer(data: bytes, fields: Sequence[str] | None = None) -> list[dict[str, Any]]:
     """Parst einen bereits eingelesenen .DBF-Bytepuffer (siehe :func:`read_dbf`).
 
     Getrennt vom Dateizugriff, damit Aufrufer die Bytes nur EINMAL lesen müssen
@@ -241,51 +527,25 @@ def read_dbf_buffer(data: bytes) -> list[dict[str, Any]]:
     """
     if len(data) < 32:
         return []
-    f = io.BytesIO(data)
-    # Header lesen (32 Bytes)
-    header = f.read(32)
-
-    num_records = struct.unpack_from("<I", header, 4)[0]
-    header_size = struct.unpack_from("<H", header, 8)[0]
-    record_size = struct.unpack_from("<H", header, 10)[0]
-
-    # Felddeskriptoren lesen (je 32 Bytes, terminiert mit 0x0D)
-    fields: list[dict[str, Any]] = []
-    f.seek(32)
-    while True:
-        field_data = f.read(32)
-        if not field_data or len(field_data) < 32 or field_data[0] == 0x0D:
-            break
-        name = (
-            field_data[0:11]
-            .split(b"\x00")[0]
-            .decode("ascii", errors="replace")
-            .strip()
-        )
-        ftype = chr(field_data[11])
-        flen = field_data[16]
-        fdec = field_data[17]
-        fields.append({"name": name, "type": ftype, "len": flen, "dec": fdec})
-
-    # Datensätze lesen
-    f.seek(header_size)
-    records = []
-    names = _dedupe_names([str(f_["name"]) for f_ in fields])
-    # Feld-Specs einmal je Tabelle berechnen und für alle Datensätze nutzen.
-    specs = _compile_field_specs(fields, names)
+    num_records = struct.unpack_from("<I", data, 4)[0]
+    header_size = struct.unpack_from("<H", data, 8)[0]
+    record_size = struct.unpack_from("<H", data, 10)[0]
 
-    for _ in range(num_records):
-        raw = f.read(record_size)
-        if not raw or len(raw) < record_size:
-            break
-
-        # Gelöschte Datensätze überspringen (erstes Byte = 0x2A = '*')
-        if raw[0] == 0x2A:
-            continue
+    # Felddeskriptoren (je 32 Bytes, terminiert mit 0x0D) bis zur Header-Länge
+    descriptors = _parse_descriptors(data[32:header_size])
+    if record_size == 0:
+        return []
 
-        records.append(_parse_record_specs(raw, specs))
+    names = _dedupe_names([str(f_["name"]) for f_ in descriptors])
+    # Feld-Specs einmal je Tabelle berechnen und für alle Datensätze nutzen.
+    specs = _project_specs(_compile_field_specs(descriptors, names), fields)
 
-    return records
+    # Datensätze direkt aus dem Puffer zerlegen; nur vollständige Sätze
+    # (abgeschnittene Datei: wie beim Kurz-Read stoppen).
+    complete = min(num_records, max(len(data) - header_size, 0) // record_size)
+    records = memoryview(data)[header_size : header_size + complete * record_size]
+    unpack = _record_unpacker(specs, record_size)
+    return list(_parse_records(records, record_size, unpack, _dict_parser(specs)))
 
 
 def get_table_fields(filepath: str) -> list[dict[str, Any]]:
@@ -298,19 +558,5 @@ def get_table_fields(filepath: str) -> list[dict[str, Any]]:
         hdr = f.read(32)
         if len(hdr) < 32:
             return []  # leere oder abgeschnittene Datei
-        fields = []
-        while True:
-            field_data = f.read(32)
-            if not field_data or len(field_data) < 32 or field_data[0] == 0x0D:
-                break
-            name = (
-                field_data[0:11]
-                .split(b"\x00")[0]
-                .decode("ascii", errors="replace")
-                .strip()
-            )
-            ftype = chr(field_data[11])
-            flen = field_data[16]
-            fdec = field_data[17]
-            fields.append({"name": name, "type": ftype, "len": flen, "dec": fdec})
-    return fields
+        header_size = struct.unpack_from("<H", hdr, 8)[0]
+        return _parse_descriptors(f.read(max(header_size - 32, 0)))
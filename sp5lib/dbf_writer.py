@@ -80,13 +80,16 @@ import fcntl
 import logging
 import os
 import struct
+from collections.abc import Callable
 from contextlib import contextmanager
 from datetime import date
 from typing import Any
 
 from .dbf_reader import (
+    _compile_field_specs,
     _dedupe_names,
     _parse_record,
+    _parse_record_specs,
     get_table_fields,
 )
 
@@ -164,75 +167,98 @@ def _encode_string(value: str, field_len: int) -> bytes:
     return result[:field_len]
 
 
-def _encode_field(value: Any, field: dict) -> bytes:
-    """Kodiert einen Einzelwert gemäß seinem DBF-Felddeskriptor."""
+def _encode_char(value: Any, field: dict) -> bytes:
+    """C-Feld: UTF-16 LE, ASCII-Klasse (cp1252) oder Binärfeld (rohe Bytes)."""
+    flen = field["len"]
+    # Binärfelder (Spec D-21): rohe Bytes, \x00-aufgefüllt.
+    if isinstance(value, bytes):
+        return (value + b"\x00" * flen)[:flen]
+    if _is_ascii_c_field(field["name"]):
+        # ASCII-class fields (Spec D-20/D-31): plain cp1252, space-padded.
+        s = str(value) if value else ""
+        encoded = s.encode("cp1252", errors="replace")
+        if len(encoded) > flen:
+            logger.warning(
+                "DBF ASCII field truncation: %s value '%s' exceeds %d bytes",
+                field["name"], s[:30], flen,
+            )
+            encoded = encoded[:flen]
+        return encoded + b"\x20" * (flen - len(encoded))
+    return _encode_string(str(value) if value else "", flen)
+
+
+def _encode_date(value: Any, field: dict) -> bytes:
+    """D-Feld: erwartet 'YYYY-MM-DD' oder 'YYYYMMDD'; sonst Leerzeichen."""
+    flen = field["len"]
+    s = str(value).strip() if value else ""
+    if len(s) == 10 and s[4] == "-":
+        s = s.replace("-", "")  # YYYY-MM-DD → YYYYMMDD
+    if len(s) == 8 and s.isdigit():
+        return s.encode("ascii").ljust(flen)[:flen]
+    return b" " * flen
+
+
+def _encode_number(value: Any, field: dict) -> bytes:
+    """N-/F-Feld: rechtsbündig formatiert; überbreite Werte → ValueError."""
     ftype = field["type"]
     flen = field["len"]
     fdec = field["dec"]
-
-    if value is None:
+    try:
+        if ftype == "F":
+            # Spec D-15: F-Felder tragen in den Originaldateien immer 4
+            # Nachkommastellen ('7.7000'), obwohl der Deskriptor dec=0
+            # sagt. Genau dieses Byte-Format nachbilden.
+            s = f"{{:>{flen}.4f}}".format(float(value))
+        elif fdec > 0:
+            fmt = f"{{:>{flen}.{fdec}f}}"
+            s = fmt.format(float(value))
+        else:
+            fmt = f"{{:>{flen}d}}"
+            s = fmt.format(int(float(value)))
+    except (ValueError, TypeError):
         return b" " * flen
+    # Ein rechtsbündiges Zahlenformat schneidet überbreite Werte nicht ab —
+    # Slicen würde still die *höchstwertigen* Ziffern/das Vorzeichen
+    # verwerfen und den Betrag verfälschen (z. B. 99999 -> "9999").
+    # Ablehnen statt korrumpieren.
+    if len(s) > flen:
+        raise ValueError(
+            f"Numeric value {value!r} does not fit field "
+            f"{field.get('name', '?')} (len={flen}, dec={fdec})"
+        )
+    return s.encode("ascii")
 
-    if ftype == "C":
-        # Binärfelder (Spec D-21): rohe Bytes, \x00-aufgefüllt.
-        if isinstance(value, bytes):
-            return (value + b"\x00" * flen)[:flen]
-        if _is_ascii_c_field(field["name"]):
-            # ASCII-class fields (Spec D-20/D-31): plain cp1252, space-padded.
-            s = str(value) if value else ""
-            encoded = s.encode("cp1252", errors="replace")
-            if len(encoded) > flen:
-                logger.warning(
-                    "DBF ASCII field truncation: %s value '%s' exceeds %d bytes",
-                    field["name"], s[:30], flen,
-                )
-                encoded = encoded[:flen]
-            return encoded + b"\x20" * (flen - len(encoded))
-        return _encode_string(str(value) if value else "", flen)
-
-    elif ftype == "D":
-        # Erwartet 'YYYY-MM-DD' oder 'YYYYMMDD'; leere Werte mit Leerzeichen aufgefüllt
-        s = str(value).strip() if value else ""
-        if len(s) == 10 and s[4] == "-":
-            s = s.replace("-", "")  # YYYY-MM-DD → YYYYMMDD
-        if len(s) == 8 and s.isdigit():
-            return s.encode("ascii").ljust(flen)[:flen]
-        return b" " * flen
 
-    elif ftype in ("N", "F"):
-        try:
-            if ftype == "F":
-                # Spec D-15: F-Felder tragen in den Originaldateien immer 4
-                # Nachkommastellen ('7.7000'), obwohl der Deskriptor dec=0
-                # sagt. Genau dieses Byte-Format nachbilden.
-                s = f"{{:>{flen}.4f}}".format(float(value))
-            elif fdec > 0:
-                fmt = f"{{:>{flen}.{fdec}f}}"
-                s = fmt.format(float(value))
-            else:
-                fmt = f"{{:>{flen}d}}"
-                s = fmt.format(int(float(value)))
-        except (ValueError, TypeError):
-            return b" " * flen
-        # Ein rechtsbündiges Zahlenformat schneidet überbreite Werte nicht ab —
-        # Slicen würde still die *höchstwertigen* Ziffern/das Vorzeichen
-        # verwerfen und den Betrag verfälschen (z. B. 99999 -> "9999").
-        # Ablehnen statt korrumpieren.
-        if len(s) > flen:
-            raise ValueError(
-                f"Numeric value {value!r} does not fit field "
-                f"{field.get('name', '?')} (len={flen}, dec={fdec})"
-            )
-        return s.encode("ascii")
+def _encode_logical(value: Any, field: dict) -> bytes:
+    return b"T" if value else b"F"
 
-    elif ftype == "L":
-        return b"T" if value else b"F"
 
-    elif ftype == "M":
-        return b" " * flen
+def _encode_memo(value: Any, field: dict) -> bytes:
+    return b" " * field["len"]
+
+
+def _encode_other(value: Any, field: dict) -> bytes:
+    flen = field["len"]
+    return str(value).ljust(flen).encode("ascii", errors="replace")[:flen]
+
+
+#: Kodierer je DBF-Feldtyp (Gegenstück zu ``dbf_reader._CONVERTERS``); ein
+#: dict-Lookup je Feld statt der if/elif-Kette über den Typ.
+_ENCODERS: dict[str, Callable[[Any, dict], bytes]] = {
+    "C": _encode_char,
+    "D": _encode_date,
+    "N": _encode_number,
+    "F": _encode_number,
+    "L": _encode_logical,
+    "M": _encode_memo,
+}
 
-    else:
-        return str(value).ljust(flen).encode("ascii", errors="replace")[:flen]
+
+def _encode_field(value: Any, field: dict) -> bytes:
+    """Kodiert einen Einzelwert gemäß seinem DBF-Felddeskriptor."""
+    if value is None:
+        return b" " * field["len"]
+    return _ENCODERS.get(field["type"], _encode_other)(value, field)
 
 
 # ─── header helpers ───────────────────────────────────────────────────────────
@@ -757,6 +783,16 @@ def find_all_records(
         return []
 
     results: list[tuple[int, dict]] = []
+    # Feld-Specs einmal je Aufruf statt je Datensatz (_parse_record leitete
+    # Namen und Offsets für jede Zeile neu ab)
+    specs = _compile_field_specs(fields, _dedupe_names([str(f["name"]) for f in fields]))
+    # Erst nur die Filterfelder dekodieren; den ganzen Datensatz (ein dict
+    # mit allen Feldern) nur für Treffer bauen. Ein Filter auf ein Feld, das
+    # die Tabelle nicht hat, vergleicht wie bisher gegen None.
+    checks = [(spec, filters[spec[0]]) for spec in specs if spec[0] in filters]
+    known = {spec[0] for spec in specs}
+    if any(expected is not None for key, expected in filters.items() if key not in known):
+        return []
 
     try:
         open_file = open(filepath, "rb")
@@ -775,19 +811,12 @@ def find_all_records(
                 if raw[0] == 0x2A:
                     continue  # deleted
 
-                record = _parse_record(raw, fields)
-
-                if _matches(record, filters):
-                    results.append((raw_idx, record))
+                if all(
+                    convert(raw[start:end]) == expected
+                    for (_, convert, start, end), expected in checks
+                ):
+                    results.append((raw_idx, _parse_record_specs(raw, specs)))
         finally:
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
     return results
-
-
-def _matches(record: dict, filters: dict) -> bool:
-    """Liefert True, wenn *record* alle key=value-Paare aus *filters* erfüllt."""
-    for key, expected in filters.items():
-        if record.get(key) != expected:
-            return False
-    return True
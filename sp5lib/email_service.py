@@ -20,6 +20,7 @@ import logging
 import os
 import smtplib
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any
@@ -79,27 +80,32 @@ def get_config() -> EmailConfig:
 
 # ── HTML template ─────────────────────────────────────────────────────────────
 
-_HTML_TEMPLATE = """\
+# The head (with its stylesheet) is static and kept out of the format template,
+# so str.format only has to scan the short body part on each render.
+_HTML_HEAD = """\
 <!DOCTYPE html>
 <html lang="de">
 <head><meta charset="utf-8">
 <style>
-  body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-         margin: 0; padding: 0; background: #f5f7fa; color: #1e293b; }}
-  .wrap {{ max-width: 560px; margin: 24px auto; background: #fff;
-           border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,.08); }}
-  .header {{ background: #3b82f6; color: #fff; padding: 20px 24px;
-             border-radius: 8px 8px 0 0; font-size: 18px; font-weight: 600; }}
-  .body {{ padding: 24px; line-height: 1.6; }}
-  .body h2 {{ margin: 0 0 8px; font-size: 16px; color: #1e293b; }}
-  .body p {{ margin: 0 0 16px; }}
-  .cta {{ display: inline-block; background: #3b82f6; color: #fff !important;
-          text-decoration: none; padding: 10px 20px; border-radius: 6px;
-          font-weight: 500; }}
-  .footer {{ padding: 16px 24px; font-size: 12px; color: #94a3b8;
-             border-top: 1px solid #e2e8f0; text-align: center; }}
+  body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        margin: 0; padding: 0; background: #f5f7fa; color: #1e293b; }
+  .wrap { max-width: 560px; margin: 24px auto; background: #fff;
+          border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,.08); }
+  .header { background: #3b82f6; color: #fff; padding: 20px 24px;
+            border-radius: 8px 8px 0 0; font-size: 18px; font-weight: 600; }
+  .body { padding: 24px; line-height: 1.6; }
+  .body h2 { margin: 0 0 8px; font-size: 16px; color: #1e293b; }
+  .body p { margin: 0 0 16px; }
+  .cta { display: inline-block; background: #3b82f6; color: #fff !important;
+         text-decoration: none; padding: 10px 20px; border-radius: 6px;
+         font-weight: 500; }
+  .footer { padding: 16px 24px; font-size: 12px; color: #94a3b8;
+            border-top: 1px solid #e2e8f0; text-align: center; }
 </style></head>
 <body>
+"""
+
+_HTML_BODY_TEMPLATE = """\
 <div class="wrap">
   <div class="header">📋 OpenSchichtplaner5</div>
   <div class="body">
@@ -146,7 +152,7 @@ def _render_html(
     # prevent stored HTML/script injection in notification emails. The newline→<br>
     # conversion happens after escaping so the inserted <br> tags survive.
     safe_message = html.escape(message).replace("\n", "<br>")
-    return _HTML_TEMPLATE.format(
+    return _HTML_HEAD + _HTML_BODY_TEMPLATE.format(
         title=html.escape(title),
         message=safe_message,
         cta_html=cta_html,
@@ -191,9 +197,9 @@ def send_email(
     msg["Subject"] = subject
 
     plain = _render_plain(title, message, link, cfg.app_url)
-    html = _render_html(title, message, link, cfg.app_url)
+    html_body = _render_html(title, message, link, cfg.app_url)
     msg.attach(MIMEText(plain, "plain", "utf-8"))
-    msg.attach(MIMEText(html, "html", "utf-8"))
+    msg.attach(MIMEText(html_body, "html", "utf-8"))
 
     try:
         if cfg.tls_mode == "ssl":
@@ -215,6 +221,24 @@ def send_email(
         return False
 
 
+# Shared sender pool: a burst of notifications reuses a few worker threads
+# instead of starting one OS thread (and one SMTP connection attempt) per mail.
+_SEND_WORKERS = 4
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the lazily created background pool used by ``send_email_async``."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_SEND_WORKERS, thread_name_prefix="sp5-email"
+            )
+        return _executor
+
+
 def send_email_async(
     *,
     to: str,
@@ -223,13 +247,14 @@ def send_email_async(
     message: str,
     link: str | None = None,
 ) -> None:
-    """Fire-and-forget email send in a background thread."""
-    t = threading.Thread(
-        target=send_email,
-        kwargs=dict(to=to, subject=subject, title=title, message=message, link=link),
-        daemon=True,
+    """Fire-and-forget email send on the shared background pool.
+
+    At most ``_SEND_WORKERS`` sends run concurrently; further mails queue.
+    ``send_email`` logs its own failures, so the future is not awaited.
+    """
+    _get_executor().submit(
+        send_email, to=to, subject=subject, title=title, message=message, link=link
     )
-    t.start()
 
 
 # ── Notification-Email bridge ─────────────────────────────────────────────────
@@ -10,9 +10,11 @@ Thread-safety: Uses scoped sessions for multi-threaded WSGI/ASGI servers.
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import cache
 
 from sqlalchemy import create_engine as _create_engine
 from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
@@ -22,6 +24,18 @@ class Base(DeclarativeBase):
     pass
 
 
+@cache
+def mapped_attrs(model: type) -> frozenset[str]:
+    """Mapped attribute names of *model* (columns + relationships), computed once.
+
+    Used by the ORM repositories and the PostgreSQL backend to restrict
+    keyword updates to these keys — a set lookup instead of a ``hasattr``
+    probe per keyword, and methods/properties can no longer be overwritten
+    by an unexpected keyword.
+    """
+    return frozenset(sa_inspect(model).attrs.keys())
+
+
 def get_engine(url: str, echo: bool = False, **kwargs) -> Engine:
     """Create a SQLAlchemy engine for the given database URL.
 
@@ -9,10 +9,12 @@ This is the key benefit of the SQLAlchemy ORM: application code never
 writes raw SQL, so a database migration is a config change, not a rewrite.
 """
 
+from functools import cache
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
 from sqlalchemy.orm import Session
 
+from .base import mapped_attrs
 from .models import (
     Absence,
     AccountBooking,
@@ -36,6 +38,20 @@ from .models import (
 )
 
 
+@cache
+def _by_position(model: type, include_hidden: bool) -> Select:
+    """``SELECT model ORDER BY position`` without hidden rows unless requested.
+
+    Statements are immutable, so the list endpoints of the master-data
+    repositories share one prebuilt statement per (model, include_hidden)
+    instead of assembling the same ``select().order_by().where()`` per call.
+    """
+    stmt = select(model).order_by(model.position)
+    if not include_hidden:
+        stmt = stmt.where(model.hide == False)  # noqa: E712
+    return stmt
+
+
 class EmployeeRepository:
     """Data access for Employee entities."""
 
@@ -44,10 +60,7 @@ class EmployeeRepository:
 
     def get_all(self, include_hidden: bool = False) -> list[Employee]:
         """Return all employees, ordered by position."""
-        stmt = select(Employee).order_by(Employee.position)
-        if not include_hidden:
-            stmt = stmt.where(Employee.hide == False)  # noqa: E712
-        return list(self.session.scalars(stmt).all())
+        return list(self.session.scalars(_by_position(Employee, include_hidden)).all())
 
     def get_by_id(self, emp_id: int) -> Employee | None:
         """Return a single employee by ID, or None."""
@@ -65,8 +78,9 @@ class EmployeeRepository:
         emp = self.get_by_id(emp_id)
         if emp is None:
             return None
+        attrs = mapped_attrs(Employee)
         for key, value in kwargs.items():
-            if hasattr(emp, key):
+            if key in attrs:
                 setattr(emp, key, value)
         self.session.flush()
         return emp
@@ -98,10 +112,10 @@ class EmployeeRepository:
 
     def count(self, include_hidden: bool = False) -> int:
         """Return the total number of employees."""
-        stmt = select(Employee)
+        stmt = select(func.count()).select_from(Employee)
         if not include_hidden:
             stmt = stmt.where(Employee.hide == False)  # noqa: E712
-        return len(list(self.session.scalars(stmt).all()))
+        return self.session.scalar(stmt)
 
 
 class GroupRepository:
@@ -112,10 +126,7 @@ class GroupRepository:
 
     def get_all(self, include_hidden: bool = False) -> list[Group]:
         """Return all groups, ordered by position."""
-        stmt = select(Group).order_by(Group.position)
-        if not include_hidden:
-            stmt = stmt.where(Group.hide == False)  # noqa: E712
-        return list(self.session.scalars(stmt).all())
+        return list(self.session.scalars(_by_position(Group, include_hidden)).all())
 
     def get_by_id(self, group_id: int) -> Group | None:
         """Return a single group by ID, or None."""
@@ -133,8 +144,9 @@ class GroupRepository:
         group = self.get_by_id(group_id)
         if group is None:
             return None
+        attrs = mapped_attrs(Group)
         for key, value in kwargs.items():
-            if hasattr(group, key):
+            if key in attrs:
                 setattr(group, key, value)
         self.session.flush()
         return group
@@ -213,10 +225,7 @@ class ShiftRepository:
 
     def list(self, include_hidden: bool = False) -> list[Shift]:
         """Return all shifts, ordered by position."""
-        stmt = select(Shift).order_by(Shift.position)
-        if not include_hidden:
-            stmt = stmt.where(Shift.hide == False)  # noqa: E712
-        return list(self.session.scalars(stmt).all())
+        return list(self.session.scalars(_by_position(Shift, include_hidden)).all())
 
     def get(self, shift_id: int) -> Shift | None:
         """Return a single shift by ID, or None."""
@@ -231,10 +240,7 @@ class LeaveTypeRepository:
 
     def list(self, include_hidden: bool = False) -> list[LeaveType]:
         """Return all leave types, ordered by position."""
-        stmt = select(LeaveType).order_by(LeaveType.position)
-        if not include_hidden:
-            stmt = stmt.where(LeaveType.hide == False)  # noqa: E712
-        return list(self.session.scalars(stmt).all())
+        return list(self.session.scalars(_by_position(LeaveType, include_hidden)).all())
 
     def get(self, leave_type_id: int) -> LeaveType | None:
         """Return a single leave type by ID, or None."""
@@ -249,10 +255,7 @@ class WorkplaceRepository:
 
     def list(self, include_hidden: bool = False) -> list[Workplace]:
         """Return all workplaces, ordered by position."""
-        stmt = select(Workplace).order_by(Workplace.position)
-        if not include_hidden:
-            stmt = stmt.where(Workplace.hide == False)  # noqa: E712
-        return list(self.session.scalars(stmt).all())
+        return list(self.session.scalars(_by_position(Workplace, include_hidden)).all())
 
     def get(self, workplace_id: int) -> Workplace | None:
         """Return a single workplace by ID, or None."""
@@ -545,10 +548,7 @@ class CycleRepository:
 
     def list(self, include_hidden: bool = False) -> list[Cycle]:
         """Return all cycles, ordered by position."""
-        stmt = select(Cycle).order_by(Cycle.position)
-        if not include_hidden:
-            stmt = stmt.where(Cycle.hide == False)  # noqa: E712
-        return list(self.session.scalars(stmt).all())
+        return list(self.session.scalars(_by_position(Cycle, include_hidden)).all())
 
     def get(self, cycle_id: int) -> Cycle | None:
         """Return a single cycle by ID, or None."""
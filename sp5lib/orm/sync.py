@@ -15,12 +15,13 @@ Usage:
 """
 
 import logging
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, TypeVar
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from .base import get_session
+from .base import Base, get_session
 from .models import (
     Absence,
     AccountBooking,
@@ -45,19 +46,27 @@ from .models import (
 
 _log = logging.getLogger("sp5api.orm.sync")
 
+_M = TypeVar("_M", bound=Base)
 
-def _read_dbf(daten_path: str, table_name: str) -> list[dict[str, Any]]:
-    """Read a DBF table, returning list of dicts."""
+
+def _read_dbf(
+    daten_path: str, table_name: str, fields: Sequence[str] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Stream a DBF table as dicts (only *fields*, if given).
+
+    Records are decoded block by block while the sync consumes them, so the
+    table is never held as a list next to the ORM objects built from it. A
+    read error is logged and ends the stream.
+    """
     import os
 
-    from sp5lib.dbf_reader import read_dbf
+    from sp5lib.dbf_reader import iter_dbf
 
     path = os.path.join(daten_path, f"5{table_name}.DBF")
     try:
-        return read_dbf(path)
+        yield from iter_dbf(path, fields=fields)
     except Exception as exc:
         _log.warning("Could not read %s: %s", path, exc)
-        return []
 
 
 def _valid_date(value: Any) -> str | None:
@@ -75,6 +84,28 @@ def _valid_date(value: Any) -> str | None:
     return s
 
 
+def _upserter(session: Session, model: type[_M]) -> Callable[[Any], _M]:
+    """Return a get-or-create function for *model* rows keyed by primary key.
+
+    All existing rows are loaded with one SELECT up front instead of one
+    ``session.get`` (and, with autoflush, one INSERT of the previous row) per
+    DBF row. Rows created here join the same lookup, so a DBF that repeats an
+    ID still updates the same object, and all inserts go out in the caller's
+    final flush.
+    """
+    by_id: dict[Any, _M] = {obj.id: obj for obj in session.scalars(select(model))}
+
+    def upsert(entry_id: Any) -> _M:
+        obj = by_id.get(entry_id)
+        if obj is None:
+            obj = model(id=entry_id)
+            session.add(obj)
+            by_id[entry_id] = obj
+        return obj
+
+    return upsert
+
+
 def sync_employees(session: Session, daten_path: str) -> int:
     """Sync employees from 5EMPL.DBF into the ORM employees table.
 
@@ -82,6 +113,7 @@ def sync_employees(session: Session, daten_path: str) -> int:
     new records are inserted. Returns the number of synced rows.
     """
     rows = _read_dbf(daten_path, "EMPL")
+    upsert = _upserter(session, Employee)
     count = 0
 
     for r in rows:
@@ -89,10 +121,7 @@ def sync_employees(session: Session, daten_path: str) -> int:
         if not emp_id:
             continue
 
-        emp = session.get(Employee, emp_id)
-        if emp is None:
-            emp = Employee(id=emp_id)
-            session.add(emp)
+        emp = upsert(emp_id)
 
         emp.position = r.get("POSITION", 0) or 0
         emp.number = str(r.get("NUMBER") or "").strip()
@@ -135,7 +164,8 @@ def sync_groups(session: Session, daten_path: str) -> int:
     the whole sync. The two-pass approach also makes ordering irrelevant
     (parents may appear after their children in the DBF).
     """
-    rows = _read_dbf(daten_path, "GROUP")
+    rows = list(_read_dbf(daten_path, "GROUP"))  # two passes below
+    upsert = _upserter(session, Group)
     count = 0
 
     # Pass 1: upsert scalar columns; defer super_id until all groups exist.
@@ -144,10 +174,7 @@ def sync_groups(session: Session, daten_path: str) -> int:
         if not group_id:
             continue
 
-        group = session.get(Group, group_id)
-        if group is None:
-            group = Group(id=group_id)
-            session.add(group)
+        group = upsert(group_id)
 
         group.name = str(r.get("NAME") or "").strip()
         group.shortname = str(r.get("SHORTNAME") or "").strip()
@@ -191,7 +218,7 @@ def sync_group_assignments(session: Session, daten_path: str) -> int:
     and rows whose employee or group does not exist are skipped (those columns
     are real FKs, so a dangling reference would otherwise abort the sync).
     """
-    rows = _read_dbf(daten_path, "GRASG")
+    rows = _read_dbf(daten_path, "GRASG", fields=("EMPLOYEEID", "GROUPID"))
 
     # Clear existing assignments and re-insert (simple full-sync approach).
     session.query(GroupAssignment).delete()
@@ -232,6 +259,7 @@ def sync_group_assignments(session: Session, daten_path: str) -> int:
 def sync_shifts(session: Session, daten_path: str) -> int:
     """Sync shift definitions from 5SHIFT.DBF into the ORM shifts table."""
     rows = _read_dbf(daten_path, "SHIFT")
+    upsert = _upserter(session, Shift)
     count = 0
 
     for r in rows:
@@ -239,10 +267,7 @@ def sync_shifts(session: Session, daten_path: str) -> int:
         if not shift_id:
             continue
 
-        shift = session.get(Shift, shift_id)
-        if shift is None:
-            shift = Shift(id=shift_id)
-            session.add(shift)
+        shift = upsert(shift_id)
 
         shift.name = str(r.get("NAME") or "").strip()
         shift.shortname = str(r.get("SHORTNAME") or "").strip()
@@ -263,6 +288,7 @@ def sync_shifts(session: Session, daten_path: str) -> int:
 def sync_leave_types(session: Session, daten_path: str) -> int:
     """Sync leave/absence types from 5LEAVT.DBF into the ORM leave_types table."""
     rows = _read_dbf(daten_path, "LEAVT")
+    upsert = _upserter(session, LeaveType)
     count = 0
 
     for r in rows:
@@ -270,10 +296,7 @@ def sync_leave_types(session: Session, daten_path: str) -> int:
         if not lt_id:
             continue
 
-        lt = session.get(LeaveType, lt_id)
-        if lt is None:
-            lt = LeaveType(id=lt_id)
-            session.add(lt)
+        lt = upsert(lt_id)
 
         lt.name = str(r.get("NAME") or "").strip()
         lt.shortname = str(r.get("SHORTNAME") or "").strip()
@@ -294,6 +317,7 @@ def sync_leave_types(session: Session, daten_path: str) -> int:
 def sync_workplaces(session: Session, daten_path: str) -> int:
     """Sync workplace definitions from 5WOPL.DBF into the ORM workplaces table."""
     rows = _read_dbf(daten_path, "WOPL")
+    upsert = _upserter(session, Workplace)
     count = 0
 
     for r in rows:
@@ -301,10 +325,7 @@ def sync_workplaces(session: Session, daten_path: str) -> int:
         if not wp_id:
             continue
 
-        wp = session.get(Workplace, wp_id)
-        if wp is None:
-            wp = Workplace(id=wp_id)
-            session.add(wp)
+        wp = upsert(wp_id)
 
         wp.name = str(r.get("NAME") or "").strip()
         wp.shortname = str(r.get("SHORTNAME") or "").strip()
@@ -327,6 +348,7 @@ def sync_shift_assignments(session: Session, daten_path: str) -> int:
     so dangling references in dirty data do not break the sync.
     """
     rows = _read_dbf(daten_path, "MASHI")
+    upsert = _upserter(session, ShiftAssignment)
     count = 0
     skipped = 0
 
@@ -339,10 +361,7 @@ def sync_shift_assignments(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        entry = session.get(ShiftAssignment, entry_id)
-        if entry is None:
-            entry = ShiftAssignment(id=entry_id)
-            session.add(entry)
+        entry = upsert(entry_id)
 
         entry.date = date
         entry.employee_id = r.get("EMPLOYEEID", 0) or 0
@@ -360,6 +379,7 @@ def sync_shift_assignments(session: Session, daten_path: str) -> int:
 def sync_special_shifts(session: Session, daten_path: str) -> int:
     """Sync special / one-off shifts from 5SPSHI.DBF (invalid dates skipped)."""
     rows = _read_dbf(daten_path, "SPSHI")
+    upsert = _upserter(session, SpecialShift)
     count = 0
     skipped = 0
 
@@ -372,10 +392,7 @@ def sync_special_shifts(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        sp = session.get(SpecialShift, entry_id)
-        if sp is None:
-            sp = SpecialShift(id=entry_id)
-            session.add(sp)
+        sp = upsert(entry_id)
 
         sp.date = date
         sp.employee_id = r.get("EMPLOYEEID", 0) or 0
@@ -402,6 +419,7 @@ def sync_special_shifts(session: Session, daten_path: str) -> int:
 def sync_absences(session: Session, daten_path: str) -> int:
     """Sync absences from 5ABSEN.DBF (invalid dates skipped)."""
     rows = _read_dbf(daten_path, "ABSEN")
+    upsert = _upserter(session, Absence)
     count = 0
     skipped = 0
 
@@ -414,10 +432,7 @@ def sync_absences(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        ab = session.get(Absence, entry_id)
-        if ab is None:
-            ab = Absence(id=entry_id)
-            session.add(ab)
+        ab = upsert(entry_id)
 
         ab.date = date
         ab.employee_id = r.get("EMPLOYEEID", 0) or 0
@@ -438,6 +453,7 @@ def sync_absences(session: Session, daten_path: str) -> int:
 def sync_holidays(session: Session, daten_path: str) -> int:
     """Sync public holidays from 5HOLID.DBF (invalid dates skipped)."""
     rows = _read_dbf(daten_path, "HOLID")
+    upsert = _upserter(session, Holiday)
     count = 0
     skipped = 0
 
@@ -450,10 +466,7 @@ def sync_holidays(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        hol = session.get(Holiday, hol_id)
-        if hol is None:
-            hol = Holiday(id=hol_id)
-            session.add(hol)
+        hol = upsert(hol_id)
 
         hol.date = date
         hol.name = str(r.get("NAME") or "").strip()
@@ -473,6 +486,7 @@ def sync_periods(session: Session, daten_path: str) -> int:
     (a plain integer, no FK). START/END are date strings as parsed by read_dbf.
     """
     rows = _read_dbf(daten_path, "PERIO")
+    upsert = _upserter(session, Period)
     count = 0
 
     for r in rows:
@@ -480,10 +494,7 @@ def sync_periods(session: Session, daten_path: str) -> int:
         if not per_id:
             continue
 
-        per = session.get(Period, per_id)
-        if per is None:
-            per = Period(id=per_id)
-            session.add(per)
+        per = upsert(per_id)
 
         per.group_id = r.get("GROUPID", 0) or 0
         per.start = str(r.get("START") or "").strip()
@@ -499,6 +510,7 @@ def sync_periods(session: Session, daten_path: str) -> int:
 def sync_book(session: Session, daten_path: str) -> int:
     """Sync manual account/time bookings from 5BOOK.DBF (invalid dates skipped)."""
     rows = _read_dbf(daten_path, "BOOK")
+    upsert = _upserter(session, AccountBooking)
     count = 0
     skipped = 0
 
@@ -511,10 +523,7 @@ def sync_book(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        bk = session.get(AccountBooking, book_id)
-        if bk is None:
-            bk = AccountBooking(id=book_id)
-            session.add(bk)
+        bk = upsert(book_id)
 
         bk.employee_id = r.get("EMPLOYEEID", 0) or 0
         bk.date = date
@@ -532,6 +541,7 @@ def sync_book(session: Session, daten_path: str) -> int:
 def sync_overtime(session: Session, daten_path: str) -> int:
     """Sync manual overtime adjustments from 5OVER.DBF (invalid dates skipped)."""
     rows = _read_dbf(daten_path, "OVER")
+    upsert = _upserter(session, OvertimeEntry)
     count = 0
     skipped = 0
 
@@ -544,10 +554,7 @@ def sync_overtime(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        ot = session.get(OvertimeEntry, ot_id)
-        if ot is None:
-            ot = OvertimeEntry(id=ot_id)
-            session.add(ot)
+        ot = upsert(ot_id)
 
         ot.employee_id = r.get("EMPLOYEEID", 0) or 0
         ot.date = date
@@ -567,6 +574,7 @@ def sync_leave_entitlements(session: Session, daten_path: str) -> int:
     ENTITLEMNT -> entitlement, REST -> carry_forward, INDAYS -> in_days.
     """
     rows = _read_dbf(daten_path, "LEAEN")
+    upsert = _upserter(session, LeaveEntitlement)
     count = 0
 
     for r in rows:
@@ -574,10 +582,7 @@ def sync_leave_entitlements(session: Session, daten_path: str) -> int:
         if not le_id:
             continue
 
-        le = session.get(LeaveEntitlement, le_id)
-        if le is None:
-            le = LeaveEntitlement(id=le_id)
-            session.add(le)
+        le = upsert(le_id)
 
         le.employee_id = r.get("EMPLOYEEID", 0) or 0
         le.year = r.get("YEAR", 0) or 0
@@ -594,6 +599,7 @@ def sync_leave_entitlements(session: Session, daten_path: str) -> int:
 def sync_shift_demand(session: Session, daten_path: str) -> int:
     """Sync recurring shift demand from 5SHDEM.DBF (keyed by weekday, no date)."""
     rows = _read_dbf(daten_path, "SHDEM")
+    upsert = _upserter(session, ShiftDemand)
     count = 0
 
     for r in rows:
@@ -601,10 +607,7 @@ def sync_shift_demand(session: Session, daten_path: str) -> int:
         if not dem_id:
             continue
 
-        dem = session.get(ShiftDemand, dem_id)
-        if dem is None:
-            dem = ShiftDemand(id=dem_id)
-            session.add(dem)
+        dem = upsert(dem_id)
 
         dem.group_id = r.get("GROUPID", 0) or 0
         dem.weekday = r.get("WEEKDAY", 0) or 0
@@ -621,6 +624,7 @@ def sync_shift_demand(session: Session, daten_path: str) -> int:
 def sync_special_demand(session: Session, daten_path: str) -> int:
     """Sync date-specific shift demand from 5SPDEM.DBF (invalid dates skipped)."""
     rows = _read_dbf(daten_path, "SPDEM")
+    upsert = _upserter(session, SpecialDemand)
     count = 0
     skipped = 0
 
@@ -633,10 +637,7 @@ def sync_special_demand(session: Session, daten_path: str) -> int:
             skipped += 1
             continue
 
-        dem = session.get(SpecialDemand, dem_id)
-        if dem is None:
-            dem = SpecialDemand(id=dem_id)
-            session.add(dem)
+        dem = upsert(dem_id)
 
         dem.group_id = r.get("GROUPID", 0) or 0
         dem.date = date
@@ -655,6 +656,7 @@ def sync_special_demand(session: Session, daten_path: str) -> int:
 def sync_cycles(session: Session, daten_path: str) -> int:
     """Sync rotation-cycle definitions from 5CYCLE.DBF."""
     rows = _read_dbf(daten_path, "CYCLE")
+    upsert = _upserter(session, Cycle)
     count = 0
 
     for r in rows:
@@ -662,10 +664,7 @@ def sync_cycles(session: Session, daten_path: str) -> int:
         if not cyc_id:
             continue
 
-        cyc = session.get(Cycle, cyc_id)
-        if cyc is None:
-            cyc = Cycle(id=cyc_id)
-            session.add(cyc)
+        cyc = upsert(cyc_id)
 
         cyc.name = str(r.get("NAME") or "").strip()
         cyc.position = r.get("POSITION", 0) or 0
@@ -721,6 +720,7 @@ def sync_cycle_assignments(session: Session, daten_path: str) -> int:
 def sync_restrictions(session: Session, daten_path: str) -> int:
     """Sync employee shift restrictions from 5RESTR.DBF (reason <- RESERVED)."""
     rows = _read_dbf(daten_path, "RESTR")
+    upsert = _upserter(session, Restriction)
     count = 0
 
     for r in rows:
@@ -728,10 +728,7 @@ def sync_restrictions(session: Session, daten_path: str) -> int:
         if not res_id:
             continue
 
-        res = session.get(Restriction, res_id)
-        if res is None:
-            res = Restriction(id=res_id)
-            session.add(res)
+        res = upsert(res_id)
 
         res.employee_id = r.get("EMPLOYEEID", 0) or 0
         res.shift_id = r.get("SHIFTID", 0) or 0
@@ -744,6 +741,31 @@ def sync_restrictions(session: Session, daten_path: str) -> int:
     return count
 
 
+# Sync order as a flat (stats key, sync function) list: parents before the
+# tables that reference them (employees/groups before group_assignments, …).
+_SYNC_STEPS: tuple[tuple[str, Callable[[Session, str], int]], ...] = (
+    ("employees", sync_employees),
+    ("groups", sync_groups),
+    ("group_assignments", sync_group_assignments),
+    ("shifts", sync_shifts),
+    ("leave_types", sync_leave_types),
+    ("workplaces", sync_workplaces),
+    ("shift_assignments", sync_shift_assignments),
+    ("special_shifts", sync_special_shifts),
+    ("absences", sync_absences),
+    ("holidays", sync_holidays),
+    ("periods", sync_periods),
+    ("bookings", sync_book),
+    ("overtime", sync_overtime),
+    ("leave_entitlements", sync_leave_entitlements),
+    ("shift_demand", sync_shift_demand),
+    ("special_demand", sync_special_demand),
+    ("cycles", sync_cycles),
+    ("cycle_assignments", sync_cycle_assignments),
+    ("restrictions", sync_restrictions),
+)
+
+
 def sync_all(engine, daten_path: str) -> dict[str, int]:
     """Sync all supported tables from DBF into the ORM database.
 
@@ -751,26 +773,7 @@ def sync_all(engine, daten_path: str) -> dict[str, int]:
     """
     session = get_session(engine)
     try:
-        stats = {}
-        stats["employees"] = sync_employees(session, daten_path)
-        stats["groups"] = sync_groups(session, daten_path)
-        stats["group_assignments"] = sync_group_assignments(session, daten_path)
-        stats["shifts"] = sync_shifts(session, daten_path)
-        stats["leave_types"] = sync_leave_types(session, daten_path)
-        stats["workplaces"] = sync_workplaces(session, daten_path)
-        stats["shift_assignments"] = sync_shift_assignments(session, daten_path)
-        stats["special_shifts"] = sync_special_shifts(session, daten_path)
-        stats["absences"] = sync_absences(session, daten_path)
-        stats["holidays"] = sync_holidays(session, daten_path)
-        stats["periods"] = sync_periods(session, daten_path)
-        stats["bookings"] = sync_book(session, daten_path)
-        stats["overtime"] = sync_overtime(session, daten_path)
-        stats["leave_entitlements"] = sync_leave_entitlements(session, daten_path)
-        stats["shift_demand"] = sync_shift_demand(session, daten_path)
-        stats["special_demand"] = sync_special_demand(session, daten_path)
-        stats["cycles"] = sync_cycles(session, daten_path)
-        stats["cycle_assignments"] = sync_cycle_assignments(session, daten_path)
-        stats["restrictions"] = sync_restrictions(session, daten_path)
+        stats = {key: step(session, daten_path) for key, step in _SYNC_STEPS}
         session.commit()
         _log.info("ORM sync complete: %s", stats)
         return stats
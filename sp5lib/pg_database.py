@@ -16,9 +16,9 @@ import dataclasses
 import hashlib
 import json
 import logging
+from collections.abc import Iterable
 from contextlib import contextmanager
 from datetime import date, timedelta
-from typing import Any
 
 from sqlalchemy import create_engine, delete, func, select
 from sqlalchemy.orm import sessionmaker
@@ -26,7 +26,7 @@ from sqlalchemy.orm import sessionmaker
 from . import calculations as calc
 from .color_utils import bgr_to_hex, is_light_color
 from .database import SP5Database
-from .orm.base import Base
+from .orm.base import Base, mapped_attrs
 from .orm.models import Employee, Group, GroupAssignment
 from .orm.models_pg import (
     Absence,
@@ -72,6 +72,10 @@ class SP5PostgresDatabase:
         """Create all tables."""
         Base.metadata.create_all(self._engine)
 
+    def warm_cache(self) -> list[str]:
+        """No-op counterpart of SP5Database.warm_cache (PostgreSQL has no DBF cache)."""
+        return []
+
     @contextmanager
     def _session(self):
         """Context manager for a transactional session."""
@@ -229,6 +233,7 @@ class SP5PostgresDatabase:
     get_schedule_year = SP5Database.get_schedule_year
     calculate_extracharge_hours = SP5Database.calculate_extracharge_hours
     get_leave_balance_group = SP5Database.get_leave_balance_group
+    _leave_balance = SP5Database._leave_balance
     _is_night_shift = SP5Database._is_night_shift
     _decode_startend = staticmethod(SP5Database._decode_startend)
     _time_str_to_minutes = staticmethod(SP5Database._time_str_to_minutes)
@@ -246,36 +251,17 @@ class SP5PostgresDatabase:
             )
             if not include_hidden:
                 stmt = stmt.where(Employee.hide == False)
-            rows = s.scalars(stmt).all()
-            result = []
-            for emp in rows:
-                r = emp.to_dict()
-                wd = r.get("WORKDAYS", "")
-                r["WORKDAYS_LIST"] = [x == "1" for x in wd.split()] if wd else []
-                original_shortname = (r.get("SHORTNAME") or "").strip()
-                if not original_shortname:
-                    surname = (r.get("NAME", "") or "").strip()
-                    firstname = (r.get("FIRSTNAME", "") or "").strip()
-                    if firstname and surname:
-                        r["SHORTNAME"] = (firstname[0] + surname[:2]).upper()
-                    elif surname:
-                        r["SHORTNAME"] = surname[:3].upper()
-                    elif firstname:
-                        r["SHORTNAME"] = firstname[:3].upper()
-                    else:
-                        r["SHORTNAME"] = "???"
-                    r["SHORTNAME_GENERATED"] = True
-                else:
-                    r["SHORTNAME_GENERATED"] = False
-                self._color_fields(r)
-                result.append(r)
-            return result
+            return [self._employee_dict(emp) for emp in s.scalars(stmt)]
+
+    def _employee_dict(self, emp: Employee) -> dict:
+        r = emp.to_dict()
+        SP5Database._prepare_employee(r)
+        return self._color_fields(r)
 
     def get_employee(self, emp_id: int) -> dict | None:
-        for e in self.get_employees(include_hidden=True):
-            if e.get("ID") == emp_id:
-                return e
-        return None
+        with self._session() as s:
+            emp = s.get(Employee, emp_id)
+            return self._employee_dict(emp) if emp is not None else None
 
     def create_employee(self, data: dict) -> dict:
         with self._session() as s:
@@ -334,10 +320,11 @@ class SP5PostgresDatabase:
                 "NOTE4", "PHOTO",
             )
             update_data = {}
+            mapped = mapped_attrs(Employee)
             for key in updatable:
                 if key in data and data[key] is not None:
                     attr = key.lower()
-                    if hasattr(emp, attr):
+                    if attr in mapped:
                         setattr(emp, attr, data[key])
                         update_data[key] = data[key]
             s.flush()
@@ -414,12 +401,13 @@ class SP5PostgresDatabase:
             if g is None:
                 raise ValueError(f"Group {group_id} not found")
             update_data = {}
+            mapped = mapped_attrs(Group)
             for key in ("NAME", "SHORTNAME", "SUPERID", "POSITION", "HIDE"):
                 if key in data and data[key] is not None:
                     attr = key.lower()
                     if key == "SUPERID":
                         attr = "super_id"
-                    if hasattr(g, attr):
+                    if attr in mapped:
                         setattr(g, attr, data[key])
                         update_data[key] = data[key]
             s.flush()
@@ -473,32 +461,17 @@ class SP5PostgresDatabase:
             stmt = select(Shift).order_by(Shift.position)
             if not include_hidden:
                 stmt = stmt.where(Shift.hide == False)
-            rows = s.scalars(stmt).all()
-            result = []
-            for sh in rows:
-                r = sh.to_dict()
-                self._color_fields(r)
-                # Parse TIMES_BY_WEEKDAY
-                times: dict[int, Any] = {}
-                for i in range(7):
-                    val = r.get(f"STARTEND{i}", "").strip()
-                    if val and "-" in val:
-                        parts = val.split("-")
-                        if len(parts) == 2:
-                            times[i] = {"start": parts[0].strip(), "end": parts[1].strip()}
-                        else:
-                            times[i] = None
-                    else:
-                        times[i] = None
-                r["TIMES_BY_WEEKDAY"] = times
-                result.append(r)
-            return result
+            return [self._shift_dict(sh) for sh in s.scalars(stmt)]
+
+    def _shift_dict(self, sh: Shift) -> dict:
+        r = self._color_fields(sh.to_dict())
+        SP5Database._prepare_shift(r)
+        return r
 
     def get_shift(self, shift_id: int) -> dict | None:
-        for s in self.get_shifts(include_hidden=True):
-            if s.get("ID") == shift_id:
-                return s
-        return None
+        with self._session() as s:
+            sh = s.get(Shift, shift_id)
+            return self._shift_dict(sh) if sh is not None else None
 
     def create_shift(self, data: dict) -> dict:
         with self._session() as s:
@@ -1164,6 +1137,11 @@ class SP5PostgresDatabase:
         inputs = self._calc_inputs(von, bis)
         lt_map = inputs["leave_types_by_id"]
         lo, hi = von.isoformat(), bis.isoformat()
+        # Einmal je Abwesenheitsart statt je Abwesenheit klassifizieren.
+        # Urlaub: nur ENTITLED=1 zählt aufs Kontingent (CHARGETYP=1 allein,
+        # z. B. Krankheit, zählt NICHT als Urlaub); krank: per Namens-Stichwort.
+        vac_ids = {lt_id for lt_id, lt in lt_map.items() if lt.get("ENTITLED")}
+        sick_ids = {lt_id for lt_id, lt in lt_map.items() if SP5Database._is_sick_leave_type(lt)}
 
         result = []
         for emp in employees:
@@ -1195,16 +1173,10 @@ class SP5PostgresDatabase:
             abs_days = len(absences)
             vac = sick = 0
             for r in absences:
-                lt = lt_map.get(r.get("LEAVETYPID"))
-                if lt is None:
-                    continue
-                if lt.get("ENTITLED"):
+                lt_id = r.get("LEAVETYPID")
+                if lt_id in vac_ids:
                     vac += 1
-                lt_name = (lt.get("NAME", "") or "").lower()
-                lt_short = (lt.get("SHORTNAME", "") or "").lower()
-                if any(
-                    kw in lt_name or kw in lt_short for kw in ["krank", "sick", "ku"]
-                ):
+                if lt_id in sick_ids:
                     sick += 1
 
             result.append(
@@ -1385,12 +1357,18 @@ class SP5PostgresDatabase:
                 shifts_by_group.setdefault(gid, set()).add(sid)
 
         spdem_by_cell: dict[tuple[int, str, int], dict] = {}
+        spdem_shifts: dict[tuple[int, str], set[int]] = {}
         for r in spdem_rows:
             gid = r.get("GROUPID") or 0
             sid = int(r.get("SHIFTID") or 0)
             d = r.get("DATE") or ""
             if sid and d:
                 spdem_by_cell[(gid, d, sid)] = r
+                spdem_shifts.setdefault((gid, d), set()).add(sid)
+        # Regel-Schichten je Gruppe einmal sortieren; je Tag wird nur bei
+        # Sonderbedarf an diesem Tag neu gemischt (statt Kopie + Sortierung
+        # + Scan über alle 5SPDEM-Zellen je Tag und Gruppe).
+        base_shift_ids = {gid: sorted(sids) for gid, sids in shifts_by_group.items()}
 
         manual = self._movement_by_employee(ScheduleEntry, von, bis)
         special = self._movement_by_employee(SpecialShift, von, bis)
@@ -1432,11 +1410,11 @@ class SP5PostgresDatabase:
             for gid in group_ids:
                 demands = shdem_by_group.get(gid, [])
                 member_entries = member_entries_by_group.get(gid, {})
-                shift_ids = set(shifts_by_group.get(gid, set()))
-                shift_ids.update(
-                    sid for (g, dd, sid) in spdem_by_cell if g == gid and dd == iso
-                )
-                for sid in sorted(shift_ids):
+                shift_ids = base_shift_ids.get(gid, [])
+                extra = spdem_shifts.get((gid, iso))
+                if extra:
+                    shift_ids = sorted(extra.union(shift_ids))
+                for sid in shift_ids:
                     spdem = spdem_by_cell.get((gid, iso, sid))
                     if spdem is not None:
                         mn, mx = int(spdem.get("MIN") or 0), int(spdem.get("MAX") or 0)
@@ -1618,75 +1596,42 @@ class SP5PostgresDatabase:
         (Spec 3.7.1, Verbrauch nach 3.5.2/3.5.3 inkl. INTERVAL-Halbtagen) und
         über die Arten summiert. Ohne 5LEAEN-Satz kein Default-Anspruch.
         """
-        emp = self.get_employee(employee_id)
-        ctx = (
-            self._calc_context(emp)
-            if emp
-            else calc.EmployeeContext(workdays=(False,) * 8)
-        )
+        return self.get_leave_balances(year, [employee_id])[employee_id]
+
+    def get_leave_balances(self, year: int, employee_ids: Iterable[int]) -> dict[int, dict]:
+        """Urlaubskonten mehrerer Mitarbeiter ({id: balance}, wie SP5Database).
+
+        Je eine Abfrage für Ansprüche und Abwesenheiten aller angefragten
+        Mitarbeiter statt zwei Abfragen je Mitarbeiter.
+        """
+        ids = list(employee_ids)
+        emp_map: dict[int, dict] = {}
+        for e in self.get_employees(include_hidden=True):
+            emp_map.setdefault(e.get("ID"), e)
         holidays = self._calc_holidays()
+        entitled_types = [
+            lt for lt in self.get_leave_types(include_hidden=True) if lt.get("ENTITLED")
+        ]
+        leaen: dict[int, list[dict]] = {}
+        absen: dict[int, list[dict]] = {}
         with self._session() as s:
-            leaen_rows = [
-                r.to_dict()
-                for r in s.scalars(
-                    select(LeaveEntitlement).where(
-                        LeaveEntitlement.employee_id == employee_id
-                    )
-                ).all()
-            ]
-            absences = [
-                r.to_dict()
-                for r in s.scalars(
-                    select(Absence).where(Absence.employee_id == employee_id)
-                ).all()
-            ]
-
-        total_entitlement = total_carry = used = 0.0
-        by_type = []
-        for lt in self.get_leave_types(include_hidden=True):
-            if not lt.get("ENTITLED"):
-                continue
-            acct = calc.leave_account(
-                ctx,
+            for r in s.scalars(
+                select(LeaveEntitlement).where(LeaveEntitlement.employee_id.in_(ids))
+            ).all():
+                leaen.setdefault(r.employee_id, []).append(r.to_dict())
+            for r in s.scalars(select(Absence).where(Absence.employee_id.in_(ids))).all():
+                absen.setdefault(r.employee_id, []).append(r.to_dict())
+        return {
+            eid: self._leave_balance(
+                eid,
                 year,
-                lt,
-                holidays=holidays,
-                entitlements=leaen_rows,
-                absences=absences,
+                emp_map.get(eid),
+                holidays,
+                entitled_types,
+                leaen.get(eid, []),
+                absen.get(eid, []),
             )
-            total_entitlement += acct.entitlement
-            total_carry += acct.rest
-            used += acct.taken
-            # Spec 3.9.3 Nr. 6: Doppelwert genommen/verbleibend je Art
-            by_type.append(
-                {
-                    "leave_type_id": lt["ID"],
-                    "leave_type_name": lt.get("NAME", ""),
-                    "leave_type_short": lt.get("SHORTNAME", ""),
-                    "entitlement": acct.entitlement,
-                    "carry_forward": acct.rest,
-                    "total": acct.total,
-                    "used": acct.taken,
-                    "remaining": acct.remaining,
-                }
-            )
-
-        remaining = total_entitlement + total_carry - used
-        forfeiture_date = f"{year}-12-31"
-
-        return {
-            "employee_id": employee_id,
-            "year": year,
-            "entitlement": total_entitlement,
-            "carry_forward": total_carry,
-            "total": total_entitlement + total_carry,
-            "used": used,
-            "remaining": remaining,
-            "by_type": by_type,
-            "forfeiture_date": forfeiture_date,
-            "has_custom_entitlement": any(
-                r.get("YEAR") == year for r in leaen_rows
-            ),
+            for eid in ids
         }
 
     # ── Jahresabschluss: im PG-Backend nicht implementiert ────
@@ -24,6 +24,8 @@ import sqlite3
 from datetime import UTC
 from typing import Any
 
+from .dbf_reader import read_dbf
+
 _log = logging.getLogger("sp5api.sqlite_adapter")
 
 
@@ -127,16 +129,6 @@ class SP5SQLiteAdapter:
         This is a full replace sync (DELETE + INSERT) for simplicity.
         A production version would use incremental change detection.
         """
-        # Import here to avoid circular deps if adapter is used standalone
-        try:
-            from .dbf_reader import read_dbf
-        except ImportError:
-            # Allow running adapter standalone (e.g. for testing)
-            import sys
-
-            sys.path.insert(0, os.path.dirname(__file__))
-            from dbf_reader import read_dbf  # type: ignore[no-redef]
-
         def _dbf(name: str) -> list[dict[str, Any]]:
             path = os.path.join(daten_path, f"5{name}.DBF")
             try:
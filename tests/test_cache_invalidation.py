@@ -10,6 +10,8 @@ taten nur ~15 von ~55 Schreibmethoden. Seit der zentralen Invalidierung
 Der eingefrorene os.path.getmtime simuliert den gemeinsamen Zeittick.
 """
 
+from datetime import date
+
 from test_database_calculations import EMP_WEEK, URLAUB, make_db
 
 import sp5lib.database as dbmod
@@ -33,3 +35,45 @@ def test_add_absence_visible_despite_same_mtime(tmp_path, monkeypatch):
     assert db._read("ABSEN") == []  # Cache vorbelegen
     db.add_absence(1, "2014-12-01", 1)
     assert len(db._read("ABSEN")) == 1
+
+
+def test_field_index_follows_write_despite_same_mtime(tmp_path, monkeypatch):
+    db = make_db(tmp_path, {"5EMPL": [EMP_WEEK], "5LEAVT": [URLAUB], "5ABSEN": []})
+    _freeze_mtime(monkeypatch)
+    assert db._read_by_field("ABSEN") == {}  # Index vorbelegen
+    db.add_absence(1, "2014-12-01", 1)
+    assert [r["DATE"] for r in db._read_by_field("ABSEN")[1]] == ["2014-12-01"]
+
+
+def test_holiday_calendar_follows_write_despite_same_mtime(tmp_path, monkeypatch):
+    db = make_db(tmp_path, {"5HOLID": []})
+    _freeze_mtime(monkeypatch)
+    assert db._calc_holidays() == {}  # Kalender vorbelegen
+    db.create_holiday({"DATE": "2014-12-25", "NAME": "Christtag"})
+    assert db._calc_holidays() == {date(2014, 12, 25): 0}
+
+
+def test_warm_cache_prebuilds_indexes_and_skips_missing_tables(tmp_path):
+    db = make_db(tmp_path, {"5EMPL": [EMP_WEEK], "5LEAVT": [URLAUB], "5ABSEN": []})
+    assert db.warm_cache() == ["EMPL", "LEAVT", "ABSEN"]
+    assert (db.db_path, "ABSEN", ("by", "EMPLOYEEID")) in dbmod._GLOBAL_DERIVED
+
+
+def test_missing_table_logged_once_and_picked_up_when_created(tmp_path, caplog):
+    db = make_db(tmp_path, {"5EMPL": [EMP_WEEK]})
+    with caplog.at_level("ERROR", logger="sp5api"):
+        assert db._read("ABSEN") == []
+        assert db._read("ABSEN") == []
+    assert len([r for r in caplog.records if "ABSEN" in r.getMessage()]) == 1
+    make_db(tmp_path, {"5LEAVT": [URLAUB], "5ABSEN": []})
+    db.add_absence(1, "2014-12-01", 1)
+    assert len(db._read("ABSEN")) == 1
+
+
+def test_getters_leave_cached_records_untouched(tmp_path):
+    db = make_db(tmp_path, {"5EMPL": [EMP_WEEK], "5LEAVT": [URLAUB]})
+    assert db.get_employees()[0]["WORKDAYS_LIST"]
+    assert db.get_leave_types(include_hidden=True)[0]["ID"] == URLAUB["ID"]
+    assert "WORKDAYS_LIST" not in db._read("EMPL")[0]
+    assert not any(k.endswith("_HEX") for k in db._read("LEAVT")[0])
+    assert db.get_employees() is not db.get_employees()
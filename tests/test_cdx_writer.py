@@ -202,6 +202,19 @@ def test_deleted_records_excluded(tmp_path):
     assert ids == [1, 3]  # the .NOT. DELETED() filter dropped ID=2
 
 
+def test_metadata_read_back_from_multipage_cdx(tmp_path):
+    records = [(i,) for i in range(1, 201)]
+    path = _make_table(tmp_path, "T", [("ID", "N", 11)], records)
+    cdx_path = path[:-4] + ".CDX"
+    open(cdx_path, "wb").write(cdx_writer.build_cdx_bytes(path, "ID", 7, "ID_TAG"))
+    assert cdx_writer._read_key_expr(cdx_path) == "ID"
+    assert cdx_writer._read_tag_name(cdx_path) == "ID_TAG"
+    assert cdx_writer._read_counter(cdx_path, 0) == 7
+    open(cdx_path, "wb").write(b"\x00" * 512)  # truncated: no tag-list leaf
+    assert cdx_writer._read_key_expr(cdx_path) is None
+    assert cdx_writer._read_tag_name(cdx_path) is None
+
+
 # ─── the dbf_writer toggle ─────────────────────────────────────────────────────
 
 
@@ -75,6 +75,14 @@ def test_info_lists_tables_and_build(db_dir, capsys):
     assert "Schichtplaner5-Build: 17" in out
 
 
+def test_info_and_validate_parallel_match_serial(db_dir, capsys):
+    for cmd in ("info", "validate"):
+        assert main([cmd, str(db_dir)]) == 0
+        serial = capsys.readouterr().out
+        assert main([cmd, str(db_dir), "--jobs", "2"]) == 0
+        assert capsys.readouterr().out == serial
+
+
 def test_info_rejects_missing_dir(tmp_path, capsys):
     assert main(["info", str(tmp_path / "nope")]) == 2
     assert "kein Verzeichnis" in capsys.readouterr().err
@@ -95,6 +103,19 @@ def test_dump_json_default(db_dir, capsys):
     assert data[0]["FIRSTNAME"] == "Anna"
 
 
+def test_dump_json_matches_stdlib_layout(db_dir, capsys):
+    """Der streamende JSON-Export ist byte-gleich zu json.dump(indent=2)."""
+    from sp5lib.cli import _plain
+    from sp5lib.dbf_reader import read_dbf
+
+    for table in ("5EMPL", "5GROUP"):
+        assert main(["dump", str(db_dir), table]) == 0
+        expected = json.dumps(
+            read_dbf(str(db_dir / f"{table}.DBF")), ensure_ascii=False, indent=2, default=_plain
+        )
+        assert capsys.readouterr().out == expected + "\n"
+
+
 def test_dump_limit_and_short_table_name(db_dir, capsys):
     # "EMPL" (ohne 5-Präfix, ohne .DBF) wird zu 5EMPL.DBF aufgelöst
     assert main(["dump", str(db_dir), "EMPL", "--json", "--limit", "1"]) == 0
@@ -109,6 +130,40 @@ def test_dump_csv(db_dir, capsys):
     assert rows[0]["NAME"] == "Müller"
 
 
+def test_dump_csv_limit(db_dir, capsys):
+    assert main(["dump", str(db_dir), "EMPL", "--csv", "--limit", "1"]) == 0
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert [r["NAME"] for r in rows] == ["Müller"]
+
+
+def test_dump_fields_projection(db_dir, capsys):
+    assert main(["dump", str(db_dir), "EMPL", "--csv", "--fields", "name,id"]) == 0
+    assert capsys.readouterr().out.splitlines()[:2] == ["NAME,ID", "Müller,1"]
+    assert main(["dump", str(db_dir), "EMPL", "--fields", "ID,NOPE"]) == 1
+    assert "Unbekannte Felder" in capsys.readouterr().err
+
+
+def test_dump_fields_deduped_and_not_empty(db_dir, capsys):
+    assert main(["dump", str(db_dir), "EMPL", "--csv", "--fields", "id,ID,name"]) == 0
+    assert capsys.readouterr().out.splitlines()[:2] == ["ID,NAME", "1,Müller"]
+    with pytest.raises(SystemExit) as exc:
+        main(["dump", str(db_dir), "EMPL", "--fields", ","])
+    assert exc.value.code == 2
+    assert "keine Feldnamen" in capsys.readouterr().err
+
+
+def test_dump_csv_binary_field_as_hex(db_dir, capsys):
+    _create_table(
+        db_dir / "5BIN.DBF",
+        [("ID", "N", 11, 0), ("UUID", "C", 4, 0)],
+        [{"ID": 1, "UUID": b"\x00\xab\x01 "}],
+    )
+    assert main(["dump", str(db_dir), "BIN", "--csv"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["ID,UUID", "1,00ab0120"]
+    assert main(["dump", str(db_dir), "BIN", "--csv", "--fields", "ID"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["ID", "1"]
+
+
 def test_dump_csv_empty_table_has_header(db_dir, capsys):
     assert main(["dump", str(db_dir), "5GROUP", "--csv"]) == 0
     out = capsys.readouterr().out
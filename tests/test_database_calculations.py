@@ -286,6 +286,14 @@ def test_carry_forward_is_type0_booking(tmp_path):
     assert len(db.get_bookings(year=2015, employee_id=1)) == 1
 
 
+def test_carry_forward_without_note_column(tmp_path, monkeypatch):
+    """5BOOK ohne NOTE-Spalte (ältere Versionen): Übertrag wird trotzdem gebucht."""
+    monkeypatch.setitem(SPECS, "5BOOK", [s for s in SPECS["5BOOK"] if s[0] != "NOTE"])
+    db = make_db(tmp_path, {"5EMPL": [EMP_WEEK], "5BOOK": []})
+    assert db.set_carry_forward(1, 2015, 12.5)["booking_id"] == 1
+    assert len(db.get_bookings(year=2015, employee_id=1)) == 1
+
+
 def test_cycle_assignments_expand_into_hours(tmp_path):
     """Befund 9: 5CYASS-Dienste fließen ohne Materialisierung in die Iststunden."""
     cycle = {"ID": 8, "NAME": "1-Woche", "POSITION": 1, "SIZE": 1, "UNIT": 1, "HIDE": 0}
@@ -353,6 +361,11 @@ def test_leave_balance_per_type_and_half_days(tmp_path):
     assert by_type[1]["remaining"] == pytest.approx(30.5)  # 30 + 2 − 1,5
     assert by_type[14]["used"] == pytest.approx(1.0)
     assert by_type[14]["remaining"] == pytest.approx(1.0)
+    # Batch-Variante: ein Durchgang, gleiches Ergebnis je Mitarbeiter
+    assert db.get_leave_balances(2014, [1, 99]) == {
+        1: bal,
+        99: db.get_leave_balance(99, 2014),
+    }
     # Ohne 5LEAEN-Satz: kein erfundener Default-Anspruch
     (tmp_path / "leer").mkdir()
     empty = _leave_db(tmp_path / "leer", [], [])
@@ -501,6 +514,25 @@ def test_schedule_read_paths_expand_cycles(tmp_path):
     assert by_day["2014-12-06"]["kind"] is None  # Sa frei
 
 
+def test_sickness_statistics_episodes_and_bradford(tmp_path):
+    """Krankheitstage: Episoden trennt eine Lücke > 3 Tage (Bradford S² × D)."""
+    krank = dict(URLAUB, ID=3, NAME="Krankheit", SHORTNAME="K", ENTITLED=0,
+                 CARRYFWD=0, STDENTIT=0.0)
+    days = ["2014-12-01", "2014-12-02", "2014-12-05", "2014-12-15", "2013-12-15"]
+    db = make_db(tmp_path, {
+        "5EMPL": [EMP_WEEK],
+        "5LEAVT": [krank],
+        "5ABSEN": [{"ID": i, "EMPLOYEEID": 1, "DATE": d, "LEAVETYPID": 3, "TYPE": 0,
+                    "INTERVAL": 0, "START": 0, "END": 0} for i, d in enumerate(days, 1)],
+    })
+    stats = db.get_sickness_statistics(2014)
+    assert stats["total_sick_days"] == 4
+    emp = stats["per_employee"][0]
+    assert (emp["sick_days"], emp["sick_episodes"], emp["bradford_factor"]) == (4, 2, 16)
+    assert stats["per_month"][11]["sick_days"] == 4
+    assert [w["sick_days"] for w in stats["per_weekday"]] == [2, 1, 0, 0, 1, 0, 0]
+
+
 # ─── 3.9.1 Freier Auswertungszeitraum (Gap C-1) ───────────────────────────────
 
 
@@ -604,7 +636,10 @@ def test_utilization_against_demand(tmp_path):
                     "WORKPLACID": 0, "MIN": 2, "MAX": 2}],
         # Tagesbedarf Mo 8.12.: min 1 / max 1 (überschreibt Wochenbedarf)
         "5SPDEM": [{"ID": 1, "GROUPID": 1, "DATE": "2014-12-08", "SHIFTID": 1,
-                    "WORKPLACID": 0, "MIN": 1, "MAX": 1}],
+                    "WORKPLACID": 0, "MIN": 1, "MAX": 1},
+                   # Mo 22.12.: zusätzliche Schicht 2 nur per Tagesbedarf
+                   {"ID": 2, "GROUPID": 1, "DATE": "2014-12-22", "SHIFTID": 2,
+                    "WORKPLACID": 0, "MIN": 0, "MAX": 1}],
         "5MASHI": [
             # Mo 1.12.: nur MA 1 eingeteilt → 1 < min 2 ⇒ under
             {"ID": 1, "EMPLOYEEID": 1, "SHIFTID": 1, "DATE": "2014-12-01"},
@@ -634,6 +669,10 @@ def test_utilization_against_demand(tmp_path):
     assert days[2]["required_count"] is None
     assert days[2]["cells"] == []
 
+    assert [(c["shift_id"], c["source"]) for c in days[22]["cells"]] == [
+        (1, "SHDEM"), (2, "SPDEM")
+    ]
+
 
 # ─── 3.8 Zuschläge (Befunde 7 und 8, Orakel-Stammdaten der Spec) ──────────────
 
@@ -12,7 +12,17 @@ from datetime import date
 
 import pytest
 
-from sp5lib.dbf_reader import _decode_string, _is_utf16_le, _parse_date, read_dbf
+from sp5lib.dbf_reader import (
+    _decode_string,
+    _is_utf16_le,
+    _parse_date,
+    _prefetch,
+    count_records,
+    iter_dbf,
+    iter_dbf_rows,
+    read_dbf,
+    read_dbf_buffer,
+)
 from sp5lib.dbf_writer import (
     _encode_field,
     _encode_string,
@@ -61,9 +71,16 @@ SPEC = [("ID", "N", 4, 0), ("NAME", "C", 40, 0)]
 def test_parse_date_valid():
     assert _parse_date("20240615") == "2024-06-15"
     assert _parse_date("20240229") == "2024-02-29"  # leap day
+    assert _parse_date(b"20240615") == "2024-06-15"  # Rohbytes aus dem D-Feld
 
 
-@pytest.mark.parametrize("bad", ["", "abcdefgh", "20241301", "20230231", "20230229", "20230431"])
+@pytest.mark.parametrize(
+    "bad",
+    [
+        "", "abcdefgh", "20241301", "20230231", "20230229", "20230431",
+        "00000101", "+0240615", b"2024-6-1", b"\xff" * 8, b"        ",
+    ],
+)
 def test_parse_date_invalid(bad):
     assert _parse_date(bad) is None
 
@@ -75,6 +92,9 @@ def test_decode_utf16():
     raw = "Test".encode("utf-16-le") + b"\x00\x00"
     assert _is_utf16_le(raw) is True
     assert _decode_string(raw) == "Test"
+    # 0x00 0x00 an ungerader Position (U+0100 nach "A") ist kein Terminator
+    raw = "AĀb".encode("utf-16-le") + b"\x00\x00" + b"\x20" * 6
+    assert _decode_string(raw) == "AĀb"
 
 
 def test_decode_ascii():
@@ -101,6 +121,13 @@ def test_decode_short_fields():
     assert _decode_string(b"\x20\x20") == ""
 
 
+def test_decode_blank_fields():
+    # leere Felder in beiden Kodierungen: nur Füll-Leerzeichen bzw. Nullen
+    assert _decode_string(b"\x20" * 40) == ""
+    assert _decode_string(b"\x00" * 40) == ""
+    assert _decode_string(" ".encode("utf-16-le") * 3 + b"\x20\x20") == ""
+
+
 def test_decode_digit_masks_stay_ascii():
     """Reine Ziffern-/Zeitmasken (WORKDAYS, VALIDDAYS, STARTEND*) sind
     ASCII-Felder und dürfen nie als UTF-16 fehlerkannt werden."""
@@ -141,12 +168,119 @@ def test_append_read_roundtrip():
         assert {"Müller", "Köhler", "Weiß"} <= names
         # find_all_records returns (index, record) tuples
         assert len(find_all_records(path, fields)) == 3
+        # Filter: nur Treffer kommen vollständig dekodiert zurück; ein Filter
+        # auf ein fehlendes Feld vergleicht gegen None
+        assert find_all_records(path, fields, NAME="Köhler") == [
+            (1, {"ID": 2, "NAME": "Köhler"})
+        ]
+        assert find_all_records(path, fields, ID=3, NOPE=None)[0][0] == 2
+        assert find_all_records(path, fields, ID=3, NOPE=1) == []
     finally:
         os.unlink(path)
 
 
 def test_read_missing_file_returns_empty():
     assert read_dbf("/nonexistent/path/FAKE.DBF") == []
+    assert list(iter_dbf("/nonexistent/path/FAKE.DBF")) == []
+
+
+def test_prefetch_is_only_a_hint():
+    path = _write_temp_dbf(SPEC)
+    try:
+        _prefetch([path, "/nonexistent/path/FAKE.DBF"])  # fehlende Dateien: kein Fehler
+        assert [f["name"] for f in get_table_fields(path)] == ["ID", "NAME"]
+    finally:
+        os.unlink(path)
+
+
+def test_read_dbf_field_projection():
+    path = _write_temp_dbf(SPEC)
+    try:
+        append_record(path, get_table_fields(path), {"ID": 7, "NAME": "Müller"})
+        assert read_dbf(path, fields=["NAME", "ID"]) == [{"NAME": "Müller", "ID": 7}]
+        assert list(iter_dbf(path, fields=["ID"])) == [{"ID": 7}]
+        with pytest.raises(ValueError, match="NOPE"):
+            read_dbf(path, fields=["NOPE"])
+    finally:
+        os.unlink(path)
+
+
+def test_descriptors_read_up_to_header_length():
+    """Deskriptoren kommen in einem Stück aus dem Header (Länge aus Offset 8);
+    Bytes zwischen 0x0D und Header-Ende (z. B. VFP-Backlink) stören nicht."""
+    dbf = bytearray(_make_dbf(SPEC)[:-1])
+    struct.pack_into("<H", dbf, 8, len(dbf) + 263)
+    fd, path = tempfile.mkstemp(suffix=".DBF")
+    with os.fdopen(fd, "wb") as f:
+        f.write(bytes(dbf) + b"\x0d" * 263 + b"\x1a")
+    try:
+        assert [f["name"] for f in get_table_fields(path)] == ["ID", "NAME"]
+        append_record(path, get_table_fields(path), {"ID": 3, "NAME": "Weiß"})
+        assert read_dbf(path) == list(iter_dbf(path)) == [{"ID": 3, "NAME": "Weiß"}]
+    finally:
+        os.unlink(path)
+
+
+def test_iter_dbf_matches_read_dbf_across_blocks(monkeypatch):
+    """iter_dbf liest blockweise; Blockgrenzen und gelöschte Sätze dürfen das
+    Ergebnis gegenüber read_dbf nicht verändern."""
+    import sp5lib.dbf_reader as reader
+
+    path = _write_temp_dbf(SPEC)
+    try:
+        fields = get_table_fields(path)
+        for i in range(7):
+            append_record(path, fields, {"ID": i + 1, "NAME": f"Name {i}"})
+        raw = bytearray(open(path, "rb").read())
+        header_size = struct.unpack_from("<H", raw, 8)[0]
+        record_size = struct.unpack_from("<H", raw, 10)[0]
+        raw[header_size + 2 * record_size] = 0x2A  # dritten Satz löschen
+        open(path, "wb").write(bytes(raw))
+        monkeypatch.setattr(reader, "_STREAM_BLOCK_SIZE", 3 * record_size)
+        assert list(iter_dbf(path)) == read_dbf(path) == read_dbf_buffer(bytes(raw))
+        assert [r["ID"] for r in iter_dbf(path)] == [1, 2, 4, 5, 6, 7]
+        assert count_records(path) == 6
+        assert list(iter_dbf_rows(path)) == [tuple(r.values()) for r in read_dbf(path)]
+        assert list(iter_dbf_rows(path, ["NAME", "ID"]))[0] == ("Name 0", 1)
+    finally:
+        os.unlink(path)
+
+
+def test_record_unpacker_orders_and_falls_back():
+    """struct-Zerlegung liefert die Chunks in Spec-Reihenfolge; überlappende
+    Specs (doppelt angefordertes Feld) oder ein zu kleiner record_size im
+    Header fallen auf das Schneiden je Feld zurück."""
+    from sp5lib.dbf_reader import _compile_field_specs, _project_specs, _record_unpacker
+
+    fields = [{"name": "ID", "type": "N", "len": 4, "dec": 0},
+              {"name": "NAME", "type": "C", "len": 3, "dec": 0}]
+    specs = _compile_field_specs(fields, ["ID", "NAME"])
+    buf = b" 1234abc*   7xyz"
+    assert list(_record_unpacker(specs, 8)(buf)) == [(b"1234", b"abc"), (b"   7", b"xyz")]
+    swapped = _project_specs(specs, ["NAME", "ID"])
+    assert list(_record_unpacker(swapped, 8)(buf))[1] == (b"xyz", b"   7")
+    twice = _project_specs(specs, ["ID", "ID"])
+    assert list(_record_unpacker(twice, 8)(buf))[0] == (b"1234", b"1234")
+    assert list(_record_unpacker(specs, 6)(buf[:12])) == [(b"1234", b"a"), (b"c*  ", b" ")]
+
+
+@pytest.mark.parametrize(
+    "raw, number, decimal",
+    [
+        (b"         42", 42, 42.0),
+        (b"     7.7000", 7.7, 7.7),
+        (b"  -3", -3, -3.0),
+        (b" 12. ", 12.0, 12.0),
+        (b"           ", 0, 0),
+        (b".", 0, 0),
+        (b"\xff\xfe", 0, 0),
+    ],
+)
+def test_numeric_converters_parse_raw_bytes(raw, number, decimal):
+    from sp5lib.dbf_reader import _convert_decimal, _convert_number
+
+    assert _convert_number(raw) == number and type(_convert_number(raw)) is type(number)
+    assert _convert_decimal(raw) == decimal
 
 
 # ─── record-size mismatch guard ───────────────────────────────────────────────
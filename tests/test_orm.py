@@ -22,6 +22,7 @@ from sp5lib.orm import (
     CycleAssignmentRepository,
     CycleRepository,
     Employee,
+    EmployeeRepository,
     Group,
     GroupAssignment,
     Holiday,
@@ -53,6 +54,7 @@ from sp5lib.orm import (
     init_db,
 )
 from sp5lib.orm.base import session_scope
+from sp5lib.orm.repository import _by_position
 
 
 @pytest.fixture
@@ -114,6 +116,34 @@ def test_shift_repository_get(engine):
         assert repo.get(999) is None
 
 
+def test_employee_repository_update_sets_only_mapped_attributes(engine):
+    with session_scope(engine) as session:
+        session.add(Employee(id=1, name="Muster"))
+        session.flush()
+        repo = EmployeeRepository(session)
+        emp = repo.update(1, name="Neu", to_dict="kein Feld", bogus=1)
+        assert emp.name == "Neu"
+        assert callable(emp.to_dict) and not hasattr(emp, "bogus")
+
+
+def test_employee_repository_count_and_shared_list_statement(engine):
+    with session_scope(engine) as session:
+        session.add_all(
+            [
+                Employee(id=1, name="A", position=2),
+                Employee(id=2, name="B", position=1),
+                Employee(id=3, name="C", position=3, hide=True),
+            ]
+        )
+        session.flush()
+        repo = EmployeeRepository(session)
+        assert repo.count() == 2
+        assert repo.count(include_hidden=True) == 3
+        assert [e.id for e in repo.get_all()] == [2, 1]
+        assert [e.id for e in repo.get_all(include_hidden=True)] == [2, 1, 3]
+        assert _by_position(Employee, False) is _by_position(Employee, False)
+
+
 def test_leave_type_repository(engine):
     with session_scope(engine) as session:
         session.add_all(
@@ -192,7 +222,7 @@ def _patch_dbf(monkeypatch, table_rows):
     """Patch sync._read_dbf to serve canned rows keyed by DBF table name."""
     from sp5lib.orm import sync
 
-    def fake_read(_daten_path, table_name):
+    def fake_read(_daten_path, table_name, fields=None):
         return table_rows.get(table_name, [])
 
     monkeypatch.setattr(sync, "_read_dbf", fake_read)
@@ -220,6 +250,20 @@ def test_sync_shifts_insert_and_update(engine, monkeypatch):
         assert len(repo.list(include_hidden=True)) == 1
 
 
+def test_sync_repeated_dbf_id_updates_one_row(engine, monkeypatch):
+    from sp5lib.orm import sync
+
+    _patch_dbf(
+        monkeypatch,
+        {"SHIFT": [{"ID": 1, "NAME": "Früh"}, {"ID": 2, "NAME": "Spät"},
+                   {"ID": 1, "NAME": "Frühdienst"}]},
+    )
+    with session_scope(engine) as session:
+        assert sync.sync_shifts(session, "/x") == 3
+        repo = ShiftRepository(session)
+        assert [s.name for s in repo.list(include_hidden=True)] == ["Frühdienst", "Spät"]
+
+
 def test_sync_leave_types_and_workplaces(engine, monkeypatch):
     from sp5lib.orm import sync
 
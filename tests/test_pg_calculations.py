@@ -413,6 +413,17 @@ def test_leave_balance_equivalent(both):
     assert pg.get_leave_balance_group(2014, 1) == dbf.get_leave_balance_group(2014, 1)
 
 
+def test_single_row_getters_equivalent(both):
+    dbf, pg = both
+    pg_emp, dbf_emp = pg.get_employee(3), dbf.get_employee(3)
+    for key in ("SHORTNAME", "SHORTNAME_GENERATED", "WORKDAYS_LIST"):
+        assert pg_emp[key] == dbf_emp[key]
+    assert pg.get_employee(3) in pg.get_employees()
+    assert pg.get_shift(1)["TIMES_BY_WEEKDAY"] == dbf.get_shift(1)["TIMES_BY_WEEKDAY"]
+    assert pg.get_shift(1) in pg.get_shifts()
+    assert pg.get_employee(99) is None and pg.get_shift(99) is None
+
+
 def test_annual_close_not_implemented(both):
     _, pg = both
     with pytest.raises(NotImplementedError):